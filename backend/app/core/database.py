@@ -180,7 +180,13 @@ def init_database():
             ON conversations(user_id, updated_at DESC)
         """)
 
-        # 3. user_documents table - optimize conversation document queries (只有在列存在时才创建)
+        # 3. user_documents table - optimize recent document list queries
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_user_documents_uploaded_at
+            ON user_documents(user_id, uploaded_at DESC)
+        """)
+
+        # 4. user_documents table - optimize conversation document queries (只有在列存在时才创建)
         cursor.execute("PRAGMA table_info(user_documents)")
         columns = [row[1] for row in cursor.fetchall()]
         if 'conversation_id' in columns:
@@ -1,2007 +1,34 @@
 """
 从DomainWordsDict提取的技术领域知识库
-总计 1681 个高质量技术术语
+
+数据由 scripts/import_domain_dict.py 生成, 保存在同目录的
+domain_knowledge_base.json 中, 导入时一次性解析为字典。
 """
 
-DOMAIN_KNOWLEDGE_BASE = {
-    '苛化度苛化作用苛化率': {
-        'category': '化学',
-        'definition': '苛化度苛化作用苛化率是化学领域的专业术语',
-        'keywords': []
-    },
-    '没食子酸': {
-        'category': '化学',
-        'definition': '没食子酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '奎哪啶红': {
-        'category': '化学',
-        'definition': '奎哪啶红是化学领域的专业术语',
-        'keywords': []
-    },
-    '助色团': {
-        'category': '化学',
-        'definition': '助色团是化学领域的专业术语',
-        'keywords': []
-    },
-    '单分子反应': {
-        'category': '化学',
-        'definition': '单分子反应是化学领域的专业术语',
-        'keywords': []
-    },
-    '电子亲合势': {
-        'category': '化学',
-        'definition': '电子亲合势是化学领域的专业术语',
-        'keywords': []
-    },
-    '阿伏伽德罗数': {
-        'category': '化学',
-        'definition': '阿伏伽德罗数是化学领域的专业术语',
-        'keywords': []
-    },
-    '丁咯地尔': {
-        'category': '化学',
-        'definition': '丁咯地尔是化学领域的专业术语',
-        'keywords': []
-    },
-    '盐酸丁咯地尔': {
-        'category': '化学',
-        'definition': '盐酸丁咯地尔是化学领域的专业术语',
-        'keywords': []
-    },
-    '乙烯': {
-        'category': '化学',
-        'definition': '乙烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '磁量子数': {
-        'category': '化学',
-        'definition': '磁量子数是化学领域的专业术语',
-        'keywords': []
-    },
-    '副价': {
-        'category': '化学',
-        'definition': '副价是化学领域的专业术语',
-        'keywords': []
-    },
-    '均裂': {
-        'category': '化学',
-        'definition': '均裂是化学领域的专业术语',
-        'keywords': []
-    },
-    '量子数': {
-        'category': '化学',
-        'definition': '量子数是化学领域的专业术语',
-        'keywords': []
-    },
-    '氢氧化钡': {
-        'category': '化学',
-        'definition': '氢氧化钡是化学领域的专业术语',
-        'keywords': []
-    },
-    '发泡剂': {
-        'category': '化学',
-        'definition': '发泡剂是化学领域的专业术语',
-        'keywords': []
-    },
-    '镧系元素': {
-        'category': '化学',
-        'definition': '镧系元素是化学领域的专业术语',
-        'keywords': []
-    },
-    '氯化钙': {
-        'category': '化学',
-        'definition': '氯化钙是化学领域的专业术语',
-        'keywords': []
-    },
-    '甲酸': {
-        'category': '化学',
-        'definition': '甲酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '丁炔': {
-        'category': '化学',
-        'definition': '丁炔是化学领域的专业术语',
-        'keywords': []
-    },
-    '百里酚蓝': {
-        'category': '化学',
-        'definition': '百里酚蓝是化学领域的专业术语',
-        'keywords': []
-    },
-    '单萜': {
-        'category': '化学',
-        'definition': '单萜是化学领域的专业术语',
-        'keywords': []
-    },
-    '红铅': {
-        'category': '化学',
-        'definition': '红铅是化学领域的专业术语',
-        'keywords': []
-    },
-    '加成反应': {
-        'category': '化学',
-        'definition': '加成反应是化学领域的专业术语',
-        'keywords': []
-    },
-    '晶格能': {
-        'category': '化学',
-        'definition': '晶格能是化学领域的专业术语',
-        'keywords': []
-    },
-    '离子对': {
-        'category': '化学',
-        'definition': '离子对是化学领域的专业术语',
-        'keywords': []
-    },
-    '硫酸钙': {
-        'category': '化学',
-        'definition': '硫酸钙是化学领域的专业术语',
-        'keywords': []
-    },
-    '络离子': {
-        'category': '化学',
-        'definition': '络离子是化学领域的专业术语',
-        'keywords': []
-    },
-    '氯化钡': {
-        'category': '化学',
-        'definition': '氯化钡是化学领域的专业术语',
-        'keywords': []
-    },
-    '内盐': {
-        'category': '化学',
-        'definition': '内盐是化学领域的专业术语',
-        'keywords': []
-    },
-    '强电解质': {
-        'category': '化学',
-        'definition': '强电解质是化学领域的专业术语',
-        'keywords': []
-    },
-    '倾析': {
-        'category': '化学',
-        'definition': '倾析是化学领域的专业术语',
-        'keywords': []
-    },
-    '水玻璃': {
-        'category': '化学',
-        'definition': '水玻璃是化学领域的专业术语',
-        'keywords': []
-    },
-    '物理化学': {
-        'category': '化学',
-        'definition': '物理化学是化学领域的专业术语',
-        'keywords': []
-    },
-    '硝酸钡': {
-        'category': '化学',
-        'definition': '硝酸钡是化学领域的专业术语',
-        'keywords': []
-    },
-    '冰醋酸': {
-        'category': '化学',
-        'definition': '冰醋酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '红移': {
-        'category': '化学',
-        'definition': '红移是化学领域的专业术语',
-        'keywords': []
-    },
-    '三氯化磷': {
-        'category': '化学',
-        'definition': '三氯化磷是化学领域的专业术语',
-        'keywords': []
-    },
-    '试管夹': {
-        'category': '化学',
-        'definition': '试管夹是化学领域的专业术语',
-        'keywords': []
-    },
-    '弹簧夹': {
-        'category': '化学',
-        'definition': '弹簧夹是化学领域的专业术语',
-        'keywords': []
-    },
-    '五氯化磷': {
-        'category': '化学',
-        'definition': '五氯化磷是化学领域的专业术语',
-        'keywords': []
-    },
-    '硬脂酸': {
-        'category': '化学',
-        'definition': '硬脂酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '丙烷': {
-        'category': '化学',
-        'definition': '丙烷是化学领域的专业术语',
-        'keywords': []
-    },
-    '单分子亲核取代反应': {
-        'category': '化学',
-        'definition': '单分子亲核取代反应是化学领域的专业术语',
-        'keywords': []
-    },
-    '丁二烯': {
-        'category': '化学',
-        'definition': '丁二烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '烯烃': {
-        'category': '化学',
-        'definition': '烯烃是化学领域的专业术语',
-        'keywords': []
-    },
-    '表面皿': {
-        'category': '化学',
-        'definition': '表面皿是化学领域的专业术语',
-        'keywords': []
-    },
-    '标准溶液': {
-        'category': '化学',
-        'definition': '标准溶液是化学领域的专业术语',
-        'keywords': []
-    },
-    '标准状态': {
-        'category': '化学',
-        'definition': '标准状态是化学领域的专业术语',
-        'keywords': []
-    },
-    '分光光度法': {
-        'category': '化学',
-        'definition': '分光光度法是化学领域的专业术语',
-        'keywords': []
-    },
-    '金属指示剂': {
-        'category': '化学',
-        'definition': '金属指示剂是化学领域的专业术语',
-        'keywords': []
-    },
-    '聚甲基丙烯酸甲酯': {
-        'category': '化学',
-        'definition': '聚甲基丙烯酸甲酯是化学领域的专业术语',
-        'keywords': []
-    },
-    '聚碳酸酯': {
-        'category': '化学',
-        'definition': '聚碳酸酯是化学领域的专业术语',
-        'keywords': []
-    },
-    '聚异丁烯': {
-        'category': '化学',
-        'definition': '聚异丁烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '喹哪啶红': {
-        'category': '化学',
-        'definition': '喹哪啶红是化学领域的专业术语',
-        'keywords': []
-    },
-    '硫化钠': {
-        'category': '化学',
-        'definition': '硫化钠是化学领域的专业术语',
-        'keywords': []
-    },
-    '硫酸钡': {
-        'category': '化学',
-        'definition': '硫酸钡是化学领域的专业术语',
-        'keywords': []
-    },
-    '硫酸钾': {
-        'category': '化学',
-        'definition': '硫酸钾是化学领域的专业术语',
-        'keywords': []
-    },
-    '硫酸镁': {
-        'category': '化学',
-        'definition': '硫酸镁是化学领域的专业术语',
-        'keywords': []
-    },
-    '硫酸钠': {
-        'category': '化学',
-        'definition': '硫酸钠是化学领域的专业术语',
-        'keywords': []
-    },
-    '氯酚红': {
-        'category': '化学',
-        'definition': '氯酚红是化学领域的专业术语',
-        'keywords': []
-    },
-    '氯化钠': {
-        'category': '化学',
-        'definition': '氯化钠是化学领域的专业术语',
-        'keywords': []
-    },
-    '莫尔盐': {
-        'category': '化学',
-        'definition': '莫尔盐是化学领域的专业术语',
-        'keywords': []
-    },
-    '内转换': {
-        'category': '化学',
-        'definition': '内转换是化学领域的专业术语',
-        'keywords': []
-    },
-    '茜素': {
-        'category': '化学',
-        'definition': '茜素是化学领域的专业术语',
-        'keywords': []
-    },
-    '氢氧化钙': {
-        'category': '化学',
-        'definition': '氢氧化钙是化学领域的专业术语',
-        'keywords': []
-    },
-    '氢氧化铝': {
-        'category': '化学',
-        'definition': '氢氧化铝是化学领域的专业术语',
-        'keywords': []
-    },
-    '热化学': {
-        'category': '化学',
-        'definition': '热化学是化学领域的专业术语',
-        'keywords': []
-    },
-    '熔化热': {
-        'category': '化学',
-        'definition': '熔化热是化学领域的专业术语',
-        'keywords': []
-    },
-    '手性分子': {
-        'category': '化学',
-        'definition': '手性分子是化学领域的专业术语',
-        'keywords': []
-    },
-    '顺反异构': {
-        'category': '化学',
-        'definition': '顺反异构是化学领域的专业术语',
-        'keywords': []
-    },
-    '碳水化合物': {
-        'category': '化学',
-        'definition': '碳水化合物是化学领域的专业术语',
-        'keywords': []
-    },
-    '碳酸钾': {
-        'category': '化学',
-        'definition': '碳酸钾是化学领域的专业术语',
-        'keywords': []
-    },
-    '碳酸钠': {
-        'category': '化学',
-        'definition': '碳酸钠是化学领域的专业术语',
-        'keywords': []
-    },
-    '硝酸银': {
-        'category': '化学',
-        'definition': '硝酸银是化学领域的专业术语',
-        'keywords': []
-    },
-    '血卟啉': {
-        'category': '化学',
-        'definition': '血卟啉是化学领域的专业术语',
-        'keywords': []
-    },
-    '原子轨道': {
-        'category': '化学',
-        'definition': '原子轨道是化学领域的专业术语',
-        'keywords': []
-    },
-    '杂环化合物': {
-        'category': '化学',
-        'definition': '杂环化合物是化学领域的专业术语',
-        'keywords': []
-    },
-    '发烟硫酸': {
-        'category': '化学',
-        'definition': '发烟硫酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '呋喃': {
-        'category': '化学',
-        'definition': '呋喃是化学领域的专业术语',
-        'keywords': []
-    },
-    '煤焦油': {
-        'category': '化学',
-        'definition': '煤焦油是化学领域的专业术语',
-        'keywords': []
-    },
-    '石油醚': {
-        'category': '化学',
-        'definition': '石油醚是化学领域的专业术语',
-        'keywords': []
-    },
-    '四氯化碳': {
-        'category': '化学',
-        'definition': '四氯化碳是化学领域的专业术语',
-        'keywords': []
-    },
-    '乙醚': {
-        'category': '化学',
-        'definition': '乙醚是化学领域的专业术语',
-        'keywords': []
-    },
-    '乙醛': {
-        'category': '化学',
-        'definition': '乙醛是化学领域的专业术语',
-        'keywords': []
-    },
-    '氢溴酸': {
-        'category': '化学',
-        'definition': '氢溴酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '苯乙烯': {
-        'category': '化学',
-        'definition': '苯乙烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '氯苯': {
-        'category': '化学',
-        'definition': '氯苯是化学领域的专业术语',
-        'keywords': []
-    },
-    '二硫化碳': {
-        'category': '化学',
-        'definition': '二硫化碳是化学领域的专业术语',
-        'keywords': []
-    },
-    '重铬酸铵': {
-        'category': '化学',
-        'definition': '重铬酸铵是化学领域的专业术语',
-        'keywords': []
-    },
-    '醋酸铅': {
-        'category': '化学',
-        'definition': '醋酸铅是化学领域的专业术语',
-        'keywords': []
-    },
-    '铬酸铅': {
-        'category': '化学',
-        'definition': '铬酸铅是化学领域的专业术语',
-        'keywords': []
-    },
-    '聚四氟乙烯': {
-        'category': '化学',
-        'definition': '聚四氟乙烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '重铬酸钠': {
-        'category': '化学',
-        'definition': '重铬酸钠是化学领域的专业术语',
-        'keywords': []
-    },
-    '丙烯': {
-        'category': '化学',
-        'definition': '丙烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '共聚物': {
-        'category': '化学',
-        'definition': '共聚物是化学领域的专业术语',
-        'keywords': []
-    },
-    '己烯': {
-        'category': '化学',
-        'definition': '己烯是化学领域的专业术语',
-        'keywords': []
-    },
-    '丹聂耳电池': {
-        'category': '化学',
-        'definition': '丹聂耳电池是化学领域的专业术语',
-        'keywords': []
-    },
-    '多元酸': {
-        'category': '化学',
-        'definition': '多元酸是化学领域的专业术语',
-        'keywords': []
-    },
-    '方钠石': {
-        'category': '化学',
-        'definition': '方钠石是化学领域的专业术语',
-        'keywords': []
-    },
-    '毒邪内闭证': {
-        'category': '医学',
-        'definition': '毒邪内闭证是医学领域的专业术语',
-        'keywords': []
-    },
-    '参附注射液': {
-        'category': '医学',
-        'definition': '参附注射液是医学领域的专业术语',
-        'keywords': []
-    },
-    '邪盛正衰': {
-        'category': '医学',
-        'definition': '邪盛正衰是医学领域的专业术语',
-        'keywords': []
-    },
-    '夹蛇龟肉': {
-        'category': '医学',
-        'definition': '夹蛇龟肉是医学领域的专业术语',
-        'keywords': []
-    },
-    '夹蛇龟': {
-        'category': '医学',
-        'definition': '夹蛇龟是医学领域的专业术语',
-        'keywords': []
-    },
-    '直接盖髓术间接盖髓术干髓术': {
-        'category': '医学',
-        'definition': '直接盖髓术间接盖髓术干髓术是医学领域的专业术语',
-        'keywords': []
-    },
-    '参附汤': {
-        'category': '医学',
-        'definition': '参附汤是医学领域的专业术语',
-        'keywords': []
-    },
-    '盖革缪勒计数器': {
-        'category': '医学',
-        'definition': '盖革缪勒计数器是医学领域的专业术语',
-        'keywords': []
-    },
-    '荜澄茄': {
-        'category': '医学',
-        'definition': '荜澄茄是医学领域的专业术语',
-        'keywords': []
-    },
-    '大敦': {
-        'category': '医学',
-        'definition': '大敦是医学领域的专业术语',
-        'keywords': []
-    },
-    '南沙参': {
-        'category': '医学',
-        'definition': '南沙参是医学领域的专业术语',
-        'keywords': []
-    },
-    '白虎加人参汤': {
-        'category': '医学',
-        'definition': '白虎加人参汤是医学领域的专业术语',
-        'keywords': []
-    },
-    '桡尺近侧关节': {
-        'category': '医学',
-        'definition': '桡尺近侧关节是医学领域的专业术语',
-        'keywords': []
-    },
-    '归地参术汤': {
-        'category': '医学',
-        'definition': '归地参术汤是医学领域的专业术语',
-        'keywords': []
-    },
-    '地骨皮': {
-        'category': '医学',
-        'definition': '地骨皮是医学领域的专业术语',
-        'keywords': []
-    },
-    '大柴胡汤': {
-        'category': '医学',
-        'definition': '大柴胡汤是医学领域的专业术语',
-        'keywords': []
-    },
-    '奇邪': {
-        'category': '医学',
-        'definition': '奇邪是医学领域的专业术语',
-        'keywords': []
-    },
-    '大承气汤': {
-        'category': '医学',
-        'definition': '大承气汤是医学领域的专业术语',
-        'keywords': []
-    },
-    '瞿麦': {
-        'category': '医学',
-        'definition': '瞿麦是医学领域的专业术语',
-        'keywords': []
-    },
-    '四叶参': {
-        'category': '医学',
-        'definition': '四叶参是医学领域的专业术语',
-        'keywords': []
-    },
-    '大敦穴': {
-        'category': '医学',
-        'definition': '大敦穴是医学领域的专业术语',
-        'keywords': []
-    },
-    '白芍': {
-        'category': '医学',
-        'definition': '白芍是医学领域的专业术语',
-        'keywords': []
-    },
-    '阿胶': {
-        'category': '医学',
-        'definition': '阿胶是医学领域的专业术语',
-        'keywords': []
-    },
-    '板蓝根': {
-        'category': '医学',
-        'definition': '板蓝根是医学领域的专业术语',
-        'keywords': []
-    },
-    '海螵蛸': {
-        'category': '医学',
-        'definition': '海螵蛸是医学领域的专业术语',
-        'keywords': []
-    },
-    '八邪': {
-        'category': '医学',
-        'definition': '八邪是医学领域的专业术语',
-        'keywords': []
-    },
-    '太阳阳明邪迫大肠证': {
-        'category': '医学',
-        'definition': '太阳阳明邪迫大肠证是医学领域的专业术语',
-        'keywords': []
-    },
-    '鱼腥草': {
-        'category': '医学',
-        'definition': '鱼腥草是医学领域的专业术语',
-        'keywords': []
-    },
-    '地榆': {
-        'category': '医学',
-        'definition': '地榆是医学领域的专业术语',
-        'keywords': []
-    },
-    '大瘕泄': {
-        'category': '医学',
-        'definition': '大瘕泄是医学领域的专业术语',
-        'keywords': []
-    },
-    '百部': {
-        'category': '医学',
-        'definition': '百部是医学领域的专业术语',
-        'keywords': []
-    },
-    '柏子仁': {
-        'category': '医学',
-        'definition': '柏子仁是医学领域的专业术语',
-        'keywords': []
-    },
-    '陈皮': {
-        'category': '医学',
-        'definition': '陈皮是医学领域的专业术语',
-        'keywords': []
-    },
-    '党参': {
-        'category': '医学',
-        'definition': '党参是医学领域的专业术语',
-        'keywords': []
-    },
-    '柴胡': {
-        'category': '医学',
-        'definition': '柴胡是医学领域的专业术语',
-        'keywords': []
-    },
-    '赤芍': {
-        'category': '医学',
-        'definition': '赤芍是医学领域的专业术语',
-        'keywords': []
-    },
-    '茯苓': {
-        'category': '医学',
-        'definition': '茯苓是医学领域的专业术语',
-        'keywords': []
-    },
-    '桂枝': {
-        'category': '医学',
-        'definition': '桂枝是医学领域的专业术语',
-        'keywords': []
-    },
-    '地奥心血康胶囊': {
-        'category': '医学',
-        'definition': '地奥心血康胶囊是医学领域的专业术语',
-        'keywords': []
-    },
-    '蛇床子': {
-        'category': '医学',
-        'definition': '蛇床子是医学领域的专业术语',
-        'keywords': []
-    },
-    '鸡血藤': {
-        'category': '医学',
-        'definition': '鸡血藤是医学领域的专业术语',
-        'keywords': []
-    },
-    '拳参': {
-        'category': '医学',
-        'definition': '拳参是医学领域的专业术语',
-        'keywords': []
-    },
-    '柏子养心丸': {
-        'category': '医学',
-        'definition': '柏子养心丸是医学领域的专业术语',
-        'keywords': []
-    },
-    '川芎': {
-        'category': '医学',
-        'definition': '川芎是医学领域的专业术语',
-        'keywords': []
-    },
-    '野菊花': {
-        'category': '医学',
-        'definition': '野菊花是医学领域的专业术语',
-        'keywords': []
-    },
-    '马勃': {
-        'category': '医学',
-        'definition': '马勃是医学领域的专业术语',
-        'keywords': []
-    },
-    '邪热传里肺胃热盛证': {
-        'category': '医学',
-        'definition': '邪热传里肺胃热盛证是医学领域的专业术语',
-        'keywords': []
-    },
-    '干姜': {
-        'category': '医学',
-        'definition': '干姜是医学领域的专业术语',
-        'keywords': []
-    },
-    '蛤壳': {
-        'category': '医学',
-        'definition': '蛤壳是医学领域的专业术语',
-        'keywords': []
-    },
-    '鳖甲': {
-        'category': '医学',
-        'definition': '鳖甲是医学领域的专业术语',
-        'keywords': []
-    },
-    '肉桂': {
-        'category': '医学',
-        'definition': '肉桂是医学领域的专业术语',
-        'keywords': []
-    },
-    '败酱草': {
-        'category': '医学',
-        'definition': '败酱草是医学领域的专业术语',
-        'keywords': []
-    },
-    '白茅根': {
-        'category': '医学',
-        'definition': '白茅根是医学领域的专业术语',
-        'keywords': []
-    },
-    '半枝莲': {
-        'category': '医学',
-        'definition': '半枝莲是医学领域的专业术语',
-        'keywords': []
-    },
-    '参术止带糖浆': {
-        'category': '医学',
-        'definition': '参术止带糖浆是医学领域的专业术语',
-        'keywords': []
-    },
-    '尺侧副韧带': {
-        'category': '医学',
-        'definition': '尺侧副韧带是医学领域的专业术语',
-        'keywords': []
-    },
-    '赤小豆': {
-        'category': '医学',
-        'definition': '赤小豆是医学领域的专业术语',
-        'keywords': []
-    },
-    '升麻': {
-        'category': '医学',
-        'definition': '升麻是医学领域的专业术语',
-        'keywords': []
-    },
-    '夏枯草': {
-        'category': '医学',
-        'definition': '夏枯草是医学领域的专业术语',
-        'keywords': []
-    },
-    '白参': {
-        'category': '医学',
-        'definition': '白参是医学领域的专业术语',
-        'keywords': []
-    },
-    '谷精草': {
-        'category': '医学',
-        'definition': '谷精草是医学领域的专业术语',
-        'keywords': []
-    },
-    '桡侧副韧带': {
-        'category': '医学',
-        'definition': '桡侧副韧带是医学领域的专业术语',
-        'keywords': []
-    },
-    '桡尺远侧关节': {
-        'category': '医学',
-        'definition': '桡尺远侧关节是医学领域的专业术语',
-        'keywords': []
-    },
-    '款冬花': {
-        'category': '医学',
-        'definition': '款冬花是医学领域的专业术语',
-        'keywords': []
-    },
-    '秦艽': {
-        'category': '医学',
-        'definition': '秦艽是医学领域的专业术语',
-        'keywords': []
-    },
-    '天花粉': {
-        'category': '医学',
-        'definition': '天花粉是医学领域的专业术语',
-        'keywords': []
-    },
-    '薏苡仁': {
-        'category': '医学',
-        'definition': '薏苡仁是医学领域的专业术语',
-        'keywords': []
-    },
-    '泽泻': {
-        'category': '医学',
-        'definition': '泽泻是医学领域的专业术语',
-        'keywords': []
-    },
-    '竹茹': {
-        'category': '医学',
-        'definition': '竹茹是医学领域的专业术语',
-        'keywords': []
-    },
-    '白鲜皮': {
-        'category': '医学',
-        'definition': '白鲜皮是医学领域的专业术语',
-        'keywords': []
-    },
-    '地肤子': {
-        'category': '医学',
-        'definition': '地肤子是医学领域的专业术语',
-        'keywords': []
-    },
-    '毒邪流窜证': {
-        'category': '医学',
-        'definition': '毒邪流窜证是医学领域的专业术语',
-        'keywords': []
-    },
-    '毒邪内攻证': {
-        'category': '医学',
-        'definition': '毒邪内攻证是医学领域的专业术语',
-        'keywords': []
-    },
-    '毒邪蕴结证': {
-        'category': '医学',
-        'definition': '毒邪蕴结证是医学领域的专业术语',
-        'keywords': []
-    },
-    '白前': {
-        'category': '医学',
-        'definition': '白前是医学领域的专业术语',
-        'keywords': []
-    },
-    '珠子参': {
-        'category': '医学',
-        'definition': '珠子参是医学领域的专业术语',
-        'keywords': []
-    },
-    '火麻仁': {
-        'category': '医学',
-        'definition': '火麻仁是医学领域的专业术语',
-        'keywords': []
-    },
-    '荆芥': {
-        'category': '医学',
-        'definition': '荆芥是医学领域的专业术语',
-        'keywords': []
-    },
-    '麻黄': {
-        'category': '医学',
-        'definition': '麻黄是医学领域的专业术语',
-        'keywords': []
-    },
-    '牡丹皮': {
-        'category': '医学',
-        'definition': '牡丹皮是医学领域的专业术语',
-        'keywords': []
-    },
-    '青蒿': {
-        'category': '医学',
-        'definition': '青蒿是医学领域的专业术语',
-        'keywords': []
-    },
-    '砂仁': {
-        'category': '医学',
-        'definition': '砂仁是医学领域的专业术语',
-        'keywords': []
-    },
-    '射干': {
-        'category': '医学',
-        'definition': '射干是医学领域的专业术语',
-        'keywords': []
-    },
-    '桃仁': {
-        'category': '医学',
-        'definition': '桃仁是医学领域的专业术语',
-        'keywords': []
-    },
-    '细辛': {
-        'category': '医学',
-        'definition': '细辛是医学领域的专业术语',
-        'keywords': []
-    },
-    '玄参': {
-        'category': '医学',
-        'definition': '玄参是医学领域的专业术语',
-        'keywords': []
-    },
-    '玉竹': {
-        'category': '医学',
-        'definition': '玉竹是医学领域的专业术语',
-        'keywords': []
-    },
-    '知母': {
-        'category': '医学',
-        'definition': '知母是医学领域的专业术语',
-        'keywords': []
-    },
-    '猪苓': {
-        'category': '医学',
-        'definition': '猪苓是医学领域的专业术语',
-        'keywords': []
-    },
-    '矮地茶': {
-        'category': '医学',
-        'definition': '矮地茶是医学领域的专业术语',
-        'keywords': []
-    },
-    '巴戟天': {
-        'category': '医学',
-        'definition': '巴戟天是医学领域的专业术语',
-        'keywords': []
-    },
-    '参术健脾丸': {
-        'category': '医学',
-        'definition': '参术健脾丸是医学领域的专业术语',
-        'keywords': []
-    },
-    '大腹皮': {
-        'category': '医学',
-        'definition': '大腹皮是医学领域的专业术语',
-        'keywords': []
-    },
-    '大青叶': {
-        'category': '医学',
-        'definition': '大青叶是医学领域的专业术语',
-        'keywords': []
-    },
-    '盖髓术': {
-        'category': '医学',
-        'definition': '盖髓术是医学领域的专业术语',
-        'keywords': []
-    },
-    '虎杖': {
-        'category': '医学',
-        'definition': '虎杖是医学领域的专业术语',
-        'keywords': []
-    },
-    '卷柏': {
-        'category': '医学',
-        'definition': '卷柏是医学领域的专业术语',
-        'keywords': []
-    },
-    '益母草': {
-        'category': '医学',
-        'definition': '益母草是医学领域的专业术语',
-        'keywords': []
-    },
-    '郁金': {
-        'category': '医学',
-        'definition': '郁金是医学领域的专业术语',
-        'keywords': []
-    },
-    '郁李仁': {
-        'category': '医学',
-        'definition': '郁李仁是医学领域的专业术语',
-        'keywords': []
-    },
-    '虎窟佛调行': {
-        'category': '网络技术',
-        'definition': '虎窟佛调行是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '此佛彼佛': {
-        'category': '网络技术',
-        'definition': '此佛彼佛是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '伽邪舍多链': {
-        'category': '网络技术',
-        'definition': '伽邪舍多链是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '伽那格毒手蛇使': {
-        'category': '网络技术',
-        'definition': '伽那格毒手蛇使是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长剑': {
-        'category': '网络技术',
-        'definition': '长剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '藏千邪': {
-        'category': '网络技术',
-        'definition': '藏千邪是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '吸血': {
-        'category': '网络技术',
-        'definition': '吸血是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '金创药': {
-        'category': '网络技术',
-        'definition': '金创药是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '破甲': {
-        'category': '网络技术',
-        'definition': '破甲是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '布鞋': {
-        'category': '网络技术',
-        'definition': '布鞋是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '藏邪': {
-        'category': '网络技术',
-        'definition': '藏邪是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪': {
-        'category': '网络技术',
-        'definition': '长邪是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪带': {
-        'category': '网络技术',
-        'definition': '长邪带是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪护手': {
-        'category': '网络技术',
-        'definition': '长邪护手是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪戒': {
-        'category': '网络技术',
-        'definition': '长邪戒是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪裤': {
-        'category': '网络技术',
-        'definition': '长邪裤是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪链': {
-        'category': '网络技术',
-        'definition': '长邪链是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪帽': {
-        'category': '网络技术',
-        'definition': '长邪帽是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪靴': {
-        'category': '网络技术',
-        'definition': '长邪靴是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪衣': {
-        'category': '网络技术',
-        'definition': '长邪衣是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '长邪坠': {
-        'category': '网络技术',
-        'definition': '长邪坠是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '制万邪': {
-        'category': '网络技术',
-        'definition': '制万邪是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '被血浸透的绳子': {
-        'category': '网络技术',
-        'definition': '被血浸透的绳子是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '掺盐巴的油菜花': {
-        'category': '网络技术',
-        'definition': '掺盐巴的油菜花是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '沾满血的臭袜子': {
-        'category': '网络技术',
-        'definition': '沾满血的臭袜子是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '狂战士': {
-        'category': '网络技术',
-        'definition': '狂战士是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '嗜血': {
-        'category': '网络技术',
-        'definition': '嗜血是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '剑圣': {
-        'category': '网络技术',
-        'definition': '剑圣是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '锁子甲': {
-        'category': '网络技术',
-        'definition': '锁子甲是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '变身': {
-        'category': '网络技术',
-        'definition': '变身是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '青铜剑': {
-        'category': '网络技术',
-        'definition': '青铜剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '圣骑士': {
-        'category': '网络技术',
-        'definition': '圣骑士是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '邪血指环': {
-        'category': '网络技术',
-        'definition': '邪血指环是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '女妖': {
-        'category': '网络技术',
-        'definition': '女妖是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '铁剑': {
-        'category': '网络技术',
-        'definition': '铁剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '秦琼': {
-        'category': '网络技术',
-        'definition': '秦琼是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '毒牙': {
-        'category': '网络技术',
-        'definition': '毒牙是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '山贼': {
-        'category': '网络技术',
-        'definition': '山贼是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '疾风步': {
-        'category': '网络技术',
-        'definition': '疾风步是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '龟丞相': {
-        'category': '网络技术',
-        'definition': '龟丞相是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '蟹将': {
-        'category': '网络技术',
-        'definition': '蟹将是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '曾广识': {
-        'category': '网络技术',
-        'definition': '曾广识是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '邪客刀石': {
-        'category': '网络技术',
-        'definition': '邪客刀石是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '傲行邪径': {
-        'category': '网络技术',
-        'definition': '傲行邪径是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '地邪': {
-        'category': '网络技术',
-        'definition': '地邪是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '重邪云台靴': {
-        'category': '网络技术',
-        'definition': '重邪云台靴是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '濯邪': {
-        'category': '网络技术',
-        'definition': '濯邪是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '游侠': {
-        'category': '网络技术',
-        'definition': '游侠是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '龙泉剑': {
-        'category': '网络技术',
-        'definition': '龙泉剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '青锋剑': {
-        'category': '网络技术',
-        'definition': '青锋剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '重击': {
-        'category': '网络技术',
-        'definition': '重击是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '万兽王的引荐信': {
-        'category': '网络技术',
-        'definition': '万兽王的引荐信是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '夜佛乘月': {
-        'category': '网络技术',
-        'definition': '夜佛乘月是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '治疗术': {
-        'category': '网络技术',
-        'definition': '治疗术是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '阿景的承诺': {
-        'category': '网络技术',
-        'definition': '阿景的承诺是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '阿景的愤怒': {
-        'category': '网络技术',
-        'definition': '阿景的愤怒是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '藏魄奇戒': {
-        'category': '网络技术',
-        'definition': '藏魄奇戒是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '谷之岚的示警信': {
-        'category': '网络技术',
-        'definition': '谷之岚的示警信是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '呵佛招祸': {
-        'category': '网络技术',
-        'definition': '呵佛招祸是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '阿佛洛狄忒的恩宠': {
-        'category': '网络技术',
-        'definition': '阿佛洛狄忒的恩宠是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '烟雾弹': {
-        'category': '网络技术',
-        'definition': '烟雾弹是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '五雷轰顶': {
-        'category': '网络技术',
-        'definition': '五雷轰顶是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '闪避': {
-        'category': '网络技术',
-        'definition': '闪避是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '邪龙斯皮兹头部': {
-        'category': '网络技术',
-        'definition': '邪龙斯皮兹头部是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '护甲': {
-        'category': '网络技术',
-        'definition': '护甲是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '食人花': {
-        'category': '网络技术',
-        'definition': '食人花是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '方寸山': {
-        'category': '网络技术',
-        'definition': '方寸山是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '洛水大龟': {
-        'category': '网络技术',
-        'definition': '洛水大龟是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '守护者': {
-        'category': '网络技术',
-        'definition': '守护者是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '玉佩': {
-        'category': '网络技术',
-        'definition': '玉佩是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '藏经阁': {
-        'category': '网络技术',
-        'definition': '藏经阁是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '灰狼': {
-        'category': '网络技术',
-        'definition': '灰狼是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '强体术': {
-        'category': '网络技术',
-        'definition': '强体术是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '西湖大龟': {
-        'category': '网络技术',
-        'definition': '西湖大龟是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '复仇者': {
-        'category': '网络技术',
-        'definition': '复仇者是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '鬼泣': {
-        'category': '网络技术',
-        'definition': '鬼泣是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '暴击': {
-        'category': '网络技术',
-        'definition': '暴击是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '布帽': {
-        'category': '网络技术',
-        'definition': '布帽是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '伯炅': {
-        'category': '网络技术',
-        'definition': '伯炅是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '大番': {
-        'category': '网络技术',
-        'definition': '大番是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '宝箱': {
-        'category': '网络技术',
-        'definition': '宝箱是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '孙婆婆': {
-        'category': '网络技术',
-        'definition': '孙婆婆是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '巨剑': {
-        'category': '网络技术',
-        'definition': '巨剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '佛光普照': {
-        'category': '网络技术',
-        'definition': '佛光普照是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '船夫': {
-        'category': '网络技术',
-        'definition': '船夫是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '金刚护体': {
-        'category': '网络技术',
-        'definition': '金刚护体是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '清心': {
-        'category': '网络技术',
-        'definition': '清心是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '方天画戟': {
-        'category': '网络技术',
-        'definition': '方天画戟是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '大荧光弹': {
-        'category': '网络技术',
-        'definition': '大荧光弹是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '兑卦为泽': {
-        'category': '网络技术',
-        'definition': '兑卦为泽是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '玉泽龟': {
-        'category': '网络技术',
-        'definition': '玉泽龟是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '靴子': {
-        'category': '网络技术',
-        'definition': '靴子是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '杜如晦': {
-        'category': '网络技术',
-        'definition': '杜如晦是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '炼金术士': {
-        'category': '网络技术',
-        'definition': '炼金术士是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '攻击速度': {
-        'category': '网络技术',
-        'definition': '攻击速度是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '木剑': {
-        'category': '网络技术',
-        'definition': '木剑是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '铁布衫': {
-        'category': '网络技术',
-        'definition': '铁布衫是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '舍利子': {
-        'category': '网络技术',
-        'definition': '舍利子是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '店小二': {
-        'category': '网络技术',
-        'definition': '店小二是网络技术领域的专业术语',
-        'keywords': []
-    },
-    '冥想': {
-        'category': '网络技术',
-        'definition': '冥想是网络技术领域的专业术语',
-        'keywords': []
-    },
-    'string': {
-        'category': '计算机科学',
-        'definition': 'string是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '排序': {
-        'category': '计算机科学',
-        'definition': '排序是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '标识符': {
-        'category': '计算机科学',
-        'definition': '标识符是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '队列': {
-        'category': '计算机科学',
-        'definition': '队列是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '访问级别': {
-        'category': '计算机科学',
-        'definition': '访问级别是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '局部变量': {
-        'category': '计算机科学',
-        'definition': '局部变量是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全类': {
-        'category': '计算机科学',
-        'definition': '安全类是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全内核': {
-        'category': '计算机科学',
-        'definition': '安全内核是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全识别': {
-        'category': '计算机科学',
-        'definition': '安全识别是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全域': {
-        'category': '计算机科学',
-        'definition': '安全域是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '绑定': {
-        'category': '计算机科学',
-        'definition': '绑定是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '包过滤': {
-        'category': '计算机科学',
-        'definition': '包过滤是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '保留字': {
-        'category': '计算机科学',
-        'definition': '保留字是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '备份与恢复': {
-        'category': '计算机科学',
-        'definition': '备份与恢复是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '编辑程序': {
-        'category': '计算机科学',
-        'definition': '编辑程序是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '传输控制协议': {
-        'category': '计算机科学',
-        'definition': '传输控制协议是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '广度优先搜索': {
-        'category': '计算机科学',
-        'definition': '广度优先搜索是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '汇编语言': {
-        'category': '计算机科学',
-        'definition': '汇编语言是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '即插即用': {
-        'category': '计算机科学',
-        'definition': '即插即用是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '批处理': {
-        'category': '计算机科学',
-        'definition': '批处理是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '全局变量': {
-        'category': '计算机科学',
-        'definition': '全局变量是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '实参': {
-        'category': '计算机科学',
-        'definition': '实参是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '数组': {
-        'category': '计算机科学',
-        'definition': '数组是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '网件': {
-        'category': '计算机科学',
-        'definition': '网件是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '文本校对': {
-        'category': '计算机科学',
-        'definition': '文本校对是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '析构函数': {
-        'category': '计算机科学',
-        'definition': '析构函数是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '虚拟机': {
-        'category': '计算机科学',
-        'definition': '虚拟机是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '虚拟局域网': {
-        'category': '计算机科学',
-        'definition': '虚拟局域网是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '异常处理': {
-        'category': '计算机科学',
-        'definition': '异常处理是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '指针': {
-        'category': '计算机科学',
-        'definition': '指针是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '作用域': {
-        'category': '计算机科学',
-        'definition': '作用域是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全控制': {
-        'category': '计算机科学',
-        'definition': '安全控制是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全模型': {
-        'category': '计算机科学',
-        'definition': '安全模型是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全审计': {
-        'category': '计算机科学',
-        'definition': '安全审计是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全事件': {
-        'category': '计算机科学',
-        'definition': '安全事件是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全套接层': {
-        'category': '计算机科学',
-        'definition': '安全套接层是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全许可': {
-        'category': '计算机科学',
-        'definition': '安全许可是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '八叉树': {
-        'category': '计算机科学',
-        'definition': '八叉树是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '版本管理': {
-        'category': '计算机科学',
-        'definition': '版本管理是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '版本控制': {
-        'category': '计算机科学',
-        'definition': '版本控制是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '版本升级': {
-        'category': '计算机科学',
-        'definition': '版本升级是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '保留内存': {
-        'category': '计算机科学',
-        'definition': '保留内存是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '被动查询': {
-        'category': '计算机科学',
-        'definition': '被动查询是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '备份过程': {
-        'category': '计算机科学',
-        'definition': '备份过程是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '备用冗余': {
-        'category': '计算机科学',
-        'definition': '备用冗余是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '编译器': {
-        'category': '计算机科学',
-        'definition': '编译器是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '并发进程': {
-        'category': '计算机科学',
-        'definition': '并发进程是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '并行传输': {
-        'category': '计算机科学',
-        'definition': '并行传输是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '并行存储器': {
-        'category': '计算机科学',
-        'definition': '并行存储器是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '并行算法': {
-        'category': '计算机科学',
-        'definition': '并行算法是一种计算算法或技术方法',
-        'keywords': []
-    },
-    '博弈树': {
-        'category': '计算机科学',
-        'definition': '博弈树是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '不重性': {
-        'category': '计算机科学',
-        'definition': '不重性是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '递归函数': {
-        'category': '计算机科学',
-        'definition': '递归函数是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '点对点连接': {
-        'category': '计算机科学',
-        'definition': '点对点连接是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '动态规划': {
-        'category': '计算机科学',
-        'definition': '动态规划是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '断言': {
-        'category': '计算机科学',
-        'definition': '断言是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '多端口存储器': {
-        'category': '计算机科学',
-        'definition': '多端口存储器是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '多任务': {
-        'category': '计算机科学',
-        'definition': '多任务是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '二叉树': {
-        'category': '计算机科学',
-        'definition': '二叉树是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '分布式系统': {
-        'category': '计算机科学',
-        'definition': '分布式系统是一种系统架构或技术体系',
-        'keywords': []
-    },
-    '赋值': {
-        'category': '计算机科学',
-        'definition': '赋值是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '构造函数': {
-        'category': '计算机科学',
-        'definition': '构造函数是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '行地址选通': {
-        'category': '计算机科学',
-        'definition': '行地址选通是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '快速排序': {
-        'category': '计算机科学',
-        'definition': '快速排序是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '密钥建立': {
-        'category': '计算机科学',
-        'definition': '密钥建立是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '模拟退火': {
-        'category': '计算机科学',
-        'definition': '模拟退火是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '全文检索': {
-        'category': '计算机科学',
-        'definition': '全文检索是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '人工生命': {
-        'category': '计算机科学',
-        'definition': '人工生命是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '适配器': {
-        'category': '计算机科学',
-        'definition': '适配器是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '死锁': {
-        'category': '计算机科学',
-        'definition': '死锁是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '调试程序': {
-        'category': '计算机科学',
-        'definition': '调试程序是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '网络时间协议': {
-        'category': '计算机科学',
-        'definition': '网络时间协议是一种网络技术或架构',
-        'keywords': []
-    },
-    '文本检索': {
-        'category': '计算机科学',
-        'definition': '文本检索是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '稳健性': {
-        'category': '计算机科学',
-        'definition': '稳健性是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '形参': {
-        'category': '计算机科学',
-        'definition': '形参是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '异步': {
-        'category': '计算机科学',
-        'definition': '异步是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '域名系统': {
-        'category': '计算机科学',
-        'definition': '域名系统是一种系统架构或技术体系',
-        'keywords': []
-    },
-    '远程过程调用': {
-        'category': '计算机科学',
-        'definition': '远程过程调用是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '中断请求': {
-        'category': '计算机科学',
-        'definition': '中断请求是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '总线网': {
-        'category': '计算机科学',
-        'definition': '总线网是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全操作系统': {
-        'category': '计算机科学',
-        'definition': '安全操作系统是一种系统架构或技术体系',
-        'keywords': []
-    },
-    '安全策略': {
-        'category': '计算机科学',
-        'definition': '安全策略是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安全过滤器': {
-        'category': '计算机科学',
-        'definition': '安全过滤器是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '安装处理控制': {
-        'category': '计算机科学',
-        'definition': '安装处理控制是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '巴克斯范式': {
-        'category': '计算机科学',
-        'definition': '巴克斯范式是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '白箱': {
-        'category': '计算机科学',
-        'definition': '白箱是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '办公流程': {
-        'category': '计算机科学',
-        'definition': '办公流程是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '报酬分析': {
-        'category': '计算机科学',
-        'definition': '报酬分析是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '包交换': {
-        'category': '计算机科学',
-        'definition': '包交换是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '保留页选项': {
-        'category': '计算机科学',
-        'definition': '保留页选项是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '包式终端': {
-        'category': '计算机科学',
-        'definition': '包式终端是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '背包问题': {
-        'category': '计算机科学',
-        'definition': '背包问题是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '闭包': {
-        'category': '计算机科学',
-        'definition': '闭包是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '变长编码': {
-        'category': '计算机科学',
-        'definition': '变长编码是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '编程语言': {
-        'category': '计算机科学',
-        'definition': '编程语言是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '变更转储': {
-        'category': '计算机科学',
-        'definition': '变更转储是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '变化检测': {
-        'category': '计算机科学',
-        'definition': '变化检测是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '变换编码': {
-        'category': '计算机科学',
-        'definition': '变换编码是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '变换分析': {
-        'category': '计算机科学',
-        'definition': '变换分析是计算机科学领域的专业术语',
-        'keywords': []
-    },
-    '变换语义': {
-        'category': '计算机科学',
-        'definition': '变换语义是计算机科学领域的专业术语',
-        'keywords': []
-    },
-}
+import json
+from pathlib import Path
+from typing import Dict
+
+try:
+    import orjson
+except ImportError:  # 可选依赖, 缺失时使用标准库 json
+    orjson = None
+
+# 知识库数据文件路径
+KNOWLEDGE_BASE_PATH = Path(__file__).parent / "domain_knowledge_base.json"
+
+
+def load_domain_knowledge_base(path: Path = KNOWLEDGE_BASE_PATH) -> Dict[str, Dict]:
+    """
+    加载知识库数据文件
+
+    Returns:
+        {术语: {'category': ..., 'definition': ..., 'keywords': [...]}}
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+DOMAIN_KNOWLEDGE_BASE = load_domain_knowledge_base()
@@ -5,19 +5,84 @@ Run: python db_manager.py
 import sqlite3
 import os
 import sys
+import re
 from datetime import datetime
 from tabulate import tabulate
 
 # Fix Windows encoding issue
 if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "users.db")
 
+# tabulate output format; "simple" renders much faster than "grid" on large tables
+TABLEFMT = os.environ.get("DBM_TABLEFMT", "simple")
+
+# Rows fetched per batch when streaming large result sets
+FETCH_BATCH_SIZE = 500
+
+# Custom query results beyond this many rows are counted but not printed
+MAX_DISPLAY_ROWS = 5000
+
+# Shared connection for the interactive session (opened once in main)
+_conn = None
+
 def get_connection():
-    """Get database connection"""
-    return sqlite3.connect(DB_PATH)
+    """Get the shared database connection, opening it on first use"""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH)
+        _conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+            PRAGMA foreign_keys=ON;
+        """)
+    return _conn
+
+def _ensure_indexes(conn):
+    """Create the indexes used by the listing and statistics queries"""
+    conn.executescript("""
+        BEGIN;
+        CREATE INDEX IF NOT EXISTS idx_conversations_user_id ON conversations(user_id);
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation_id ON messages(conversation_id);
+        CREATE INDEX IF NOT EXISTS idx_conversations_updated_at ON conversations(user_id, updated_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_user_documents_uploaded_at ON user_documents(user_id, uploaded_at DESC);
+        COMMIT;
+    """)
+
+# Cached user id -> username map (cleared whenever users may have changed)
+_usernames = None
+
+def get_usernames(refresh=False):
+    """Return the cached user id -> username map"""
+    global _usernames
+    if _usernames is None or refresh:
+        _usernames = dict(get_connection().execute("SELECT id, username FROM users"))
+    return _usernames
+
+def invalidate_usernames():
+    """Drop the cached username map"""
+    global _usernames
+    _usernames = None
+
+def close_connection():
+    """Close the shared database connection"""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+def iter_rows(cursor, size=FETCH_BATCH_SIZE):
+    """Yield batches of rows from an executed cursor"""
+    while True:
+        batch = cursor.fetchmany(size)
+        if not batch:
+            break
+        yield batch
 
 def show_menu():
     """Display main menu"""
@@ -48,11 +113,10 @@ def list_users():
         ORDER BY created_at DESC
     """)
     users = cursor.fetchall()
-    conn.close()
 
     if users:
         headers = ["ID", "username", "邮箱", "创建时间", "更新时间"]
-        print("\n" + tabulate(users, headers=headers, tablefmt="grid"))
+        print("\n" + tabulate(users, headers=headers, tablefmt=TABLEFMT))
         print(f"\n总计: {len(users)} 个用户")
     else:
         print("\n没有找到用户")
@@ -70,7 +134,6 @@ def show_user_details():
 
     if not user:
         print(f"\n用户 '{username}' 不存在")
-        conn.close()
         return
 
     user_id = user[0]
@@ -102,27 +165,31 @@ def show_user_details():
     msg_count = cursor.fetchone()[0]
     print(f"总消息数: {msg_count}")
 
-    conn.close()
-
 def list_conversations():
     """List all conversations"""
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT c.id, u.username, c.title, c.created_at, c.updated_at,
-               COUNT(m.id) as message_count
+        SELECT c.id, c.user_id, c.title, c.created_at, c.updated_at,
+               (SELECT COUNT(*) FROM messages m WHERE m.conversation_id = c.id)
         FROM conversations c
-        JOIN users u ON c.user_id = u.id
-        LEFT JOIN messages m ON c.id = m.conversation_id
-        GROUP BY c.id
         ORDER BY c.updated_at DESC
     """)
-    conversations = cursor.fetchall()
-    conn.close()
+    rows = cursor.fetchall()
+
+    usernames = get_usernames()
+    if any(row[1] not in usernames for row in rows):
+        # Users created since the map was cached
+        usernames = get_usernames(refresh=True)
+    conversations = [
+        (conv_id, usernames[user_id], title, created, updated, msg_count)
+        for conv_id, user_id, title, created, updated, msg_count in rows
+        if user_id in usernames
+    ]
 
     if conversations:
         headers = ["对话ID", "用户", "标题", "创建时间", "更新时间", "消息数"]
-        print("\n" + tabulate(conversations, headers=headers, tablefmt="grid"))
+        print("\n" + tabulate(conversations, headers=headers, tablefmt=TABLEFMT))
         print(f"\n总计: {len(conversations)} 个对话")
     else:
         print("\n没有找到对话")
@@ -151,7 +218,6 @@ def show_conversation_messages():
 
     if not conv_info:
         print(f"\n对话 ID {conv_id} 不存在")
-        conn.close()
         return
 
     print(f"\n{'='*60}")
@@ -159,26 +225,27 @@ def show_conversation_messages():
     print(f"用户: {conv_info[1]}")
     print(f"{'='*60}\n")
 
-    # Get messages
+    # Get messages (content truncated in SQL so only the preview is copied)
     cursor.execute("""
-        SELECT id, role, content, created_at
+        SELECT id, role, substr(content, 1, 200), length(content), created_at
         FROM messages
         WHERE conversation_id = ?
         ORDER BY created_at ASC
     """, (conv_id,))
-    messages = cursor.fetchall()
 
-    if messages:
-        for msg in messages:
+    total = 0
+    for batch in iter_rows(cursor):
+        for msg in batch:
             role_label = "用户" if msg[1] == "user" else "AI"
-            print(f"[{msg[3]}] {role_label}:")
-            print(f"  {msg[2][:200]}{'...' if len(msg[2]) > 200 else ''}\n")
-        print(f"总计: {len(messages)} 条消息")
+            print(f"[{msg[4]}] {role_label}:")
+            print(f"  {msg[2]}{'...' if msg[3] > 200 else ''}\n")
+        total += len(batch)
+
+    if total:
+        print(f"总计: {total} 条消息")
     else:
         print("该对话没有消息")
 
-    conn.close()
-
 def list_documents():
     """List user documents"""
     username = input("\n输入username（留空显示所有）: ").strip()
@@ -203,11 +270,10 @@ def list_documents():
         """)
 
     documents = cursor.fetchall()
-    conn.close()
 
     if documents:
         headers = ["ID", "用户", "文件名", "路径", "上传时间"]
-        print("\n" + tabulate(documents, headers=headers, tablefmt="grid"))
+        print("\n" + tabulate(documents, headers=headers, tablefmt=TABLEFMT))
         print(f"\n总计: {len(documents)} 个文档")
     else:
         print("\n没有找到文档")
@@ -225,20 +291,26 @@ def delete_user():
 
     if not user:
         print(f"\n用户 '{username}' 不存在")
-        conn.close()
         return
 
     confirm = input(f"\n确定要删除用户 '{username}' 及其所有数据吗？(yes/no): ").strip().lower()
 
     if confirm == 'yes':
-        cursor.execute("DELETE FROM users WHERE username = ?", (username,))
-        conn.commit()
+        user_id = user[0]
+        # Delete child rows explicitly in one transaction
+        with conn:
+            conn.execute("""
+                DELETE FROM messages
+                WHERE conversation_id IN (SELECT id FROM conversations WHERE user_id = ?)
+            """, (user_id,))
+            conn.execute("DELETE FROM user_documents WHERE user_id = ?", (user_id,))
+            conn.execute("DELETE FROM conversations WHERE user_id = ?", (user_id,))
+            conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        invalidate_usernames()
         print(f"\n用户 '{username}' 已删除（包括所有对话、消息和文档记录）")
     else:
         print("\n取消删除")
 
-    conn.close()
-
 def delete_conversation():
     """Delete a conversation"""
     conv_id = input("\n输入要删除的对话ID: ").strip()
@@ -258,23 +330,33 @@ def delete_conversation():
 
     if not conv:
         print(f"\n对话 ID {conv_id} 不存在")
-        conn.close()
         return
 
     confirm = input(f"\n确定要删除对话 '{conv[0]}' 及其所有消息吗？(yes/no): ").strip().lower()
 
     if confirm == 'yes':
-        cursor.execute("DELETE FROM conversations WHERE id = ?", (conv_id,))
-        conn.commit()
-        print(f"\n对话 ID {conv_id} 已删除（包括所有消息）")
+        # Delete child rows explicitly in one transaction
+        with conn:
+            conn.execute("DELETE FROM messages WHERE conversation_id = ?", (conv_id,))
+            conn.execute("DELETE FROM user_documents WHERE conversation_id = ?", (conv_id,))
+            conn.execute("DELETE FROM conversations WHERE id = ?", (conv_id,))
+        print(f"\n对话 ID {conv_id} 已删除（包括所有消息和文档记录）")
     else:
         print("\n取消删除")
 
-    conn.close()
+# String literals, quoted identifiers and comments, whose '?' are not placeholders
+_NON_PLACEHOLDER_RE = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|\[[^\]]*\]|--[^\n]*|/\*.*?\*/",
+    re.DOTALL,
+)
+
+def count_placeholders(query):
+    """Count the '?' parameter placeholders in a query"""
+    return _NON_PLACEHOLDER_RE.sub("", query).count("?")
 
 def execute_custom_query():
     """Execute custom SQL query"""
-    print("\n输入 SQL 查询（输入 'exit' 退出）:")
+    print("\n输入 SQL 查询（输入 'exit' 退出，前缀 'explain ' 查看查询计划，'?' 作为参数占位符）:")
     query = input("> ").strip()
 
     if query.lower() == 'exit':
@@ -284,24 +366,41 @@ def execute_custom_query():
     cursor = conn.cursor()
 
     try:
-        cursor.execute(query)
+        # Show the query plan instead of running the query
+        if query.lower().startswith("explain "):
+            if not re.match(r"explain\s+query\s+plan\s", query, re.IGNORECASE):
+                query = "EXPLAIN QUERY PLAN " + query[len("explain "):]
+            cursor.execute(query)
+            plan = [(row[0], row[1], row[3]) for row in cursor.fetchall()]
+            print("\n" + tabulate(plan, headers=["id", "parent", "detail"], tablefmt=TABLEFMT))
+            return
+
+        # Bound parameters keep the SQL text stable, so repeated runs reuse
+        # the connection's cached prepared statement
+        params = tuple(input(f"参数 {i + 1}: ") for i in range(count_placeholders(query)))
+        cursor.execute(query, params)
 
         if query.strip().upper().startswith("SELECT"):
-            results = cursor.fetchall()
-            if results:
-                # Get column names
-                columns = [desc[0] for desc in cursor.description]
-                print("\n" + tabulate(results, headers=columns, tablefmt="grid"))
-                print(f"\n返回 {len(results)} 行")
+            # Get column names
+            columns = [desc[0] for desc in cursor.description]
+            # One table (single header and border) for up to MAX_DISPLAY_ROWS rows;
+            # any rows past that are only counted, a batch at a time
+            rows = cursor.fetchmany(MAX_DISPLAY_ROWS)
+            total = len(rows) + sum(len(batch) for batch in iter_rows(cursor))
+            if total:
+                print("\n" + tabulate(rows, headers=columns, tablefmt=TABLEFMT))
+                print(f"\n返回 {total} 行")
+                if total > len(rows):
+                    print(f"(只显示前 {len(rows)} 行，请使用 LIMIT/OFFSET 查看其余结果)")
             else:
                 print("\n查询没有返回结果")
         else:
             conn.commit()
+            invalidate_usernames()
             print(f"\n查询执行成功，影响 {cursor.rowcount} 行")
     except Exception as e:
+        conn.rollback()
         print(f"\n错误: {e}")
-    finally:
-        conn.close()
 
 def show_statistics():
     """Show database statistics"""
@@ -312,27 +411,20 @@ def show_statistics():
     print("数据库统计")
     print(f"{'='*60}")
 
-    # User count
-    cursor.execute("SELECT COUNT(*) FROM users")
-    user_count = cursor.fetchone()[0]
+    # Row counts (single statement instead of one round-trip per table)
+    cursor.execute("""
+        SELECT (SELECT COUNT(*) FROM users),
+               (SELECT COUNT(*) FROM conversations),
+               (SELECT COUNT(*) FROM messages),
+               (SELECT COUNT(*) FROM user_documents)
+    """)
+    user_count, conv_count, msg_count, doc_count = cursor.fetchone()
     print(f"用户总数: {user_count}")
-
-    # Conversation count
-    cursor.execute("SELECT COUNT(*) FROM conversations")
-    conv_count = cursor.fetchone()[0]
     print(f"对话总数: {conv_count}")
-
-    # Message count
-    cursor.execute("SELECT COUNT(*) FROM messages")
-    msg_count = cursor.fetchone()[0]
     print(f"消息总数: {msg_count}")
-
-    # Document count
-    cursor.execute("SELECT COUNT(*) FROM user_documents")
-    doc_count = cursor.fetchone()[0]
     print(f"文档总数: {doc_count}")
 
-    # Most active user
+    # Most active user (GROUP BY is resolved from idx_conversations_user_id)
     cursor.execute("""
         SELECT u.username, COUNT(c.id) as conv_count
         FROM users u
@@ -346,12 +438,27 @@ def show_statistics():
         print(f"最活跃用户: {active_user[0]} ({active_user[1]} 个对话)")
 
     # Database size
-    db_size = os.path.getsize(DB_PATH) / 1024  # KB
+    db_size = os.stat(DB_PATH).st_size / 1024  # KB
     print(f"数据库大小: {db_size:.2f} KB")
 
     print(f"{'='*60}")
 
-    conn.close()
+def invalid_choice():
+    """Handle an unknown menu choice"""
+    print("\n无效的选择，请重试")
+
+# Menu choice -> handler
+DISPATCH = {
+    '1': list_users,
+    '2': show_user_details,
+    '3': list_conversations,
+    '4': show_conversation_messages,
+    '5': list_documents,
+    '6': delete_user,
+    '7': delete_conversation,
+    '8': execute_custom_query,
+    '9': show_statistics,
+}
 
 def main():
     """Main function"""
@@ -359,34 +466,25 @@ def main():
         print(f"\n错误: 数据库文件不存在: {DB_PATH}")
         return
 
+    # Browsing still works without the indexes, e.g. while the backend holds the write lock
+    try:
+        _ensure_indexes(get_connection())
+    except sqlite3.OperationalError as e:
+        if _conn is not None and _conn.in_transaction:
+            _conn.rollback()
+        print(f"\n警告: 无法创建索引，查询可能较慢: {e}")
+
     while True:
         show_menu()
         choice = input("\n请选择操作 (0-9): ").strip()
 
+        if choice == '0':
+            print("\n再见！")
+            close_connection()
+            break
+
         try:
-            if choice == '1':
-                list_users()
-            elif choice == '2':
-                show_user_details()
-            elif choice == '3':
-                list_conversations()
-            elif choice == '4':
-                show_conversation_messages()
-            elif choice == '5':
-                list_documents()
-            elif choice == '6':
-                delete_user()
-            elif choice == '7':
-                delete_conversation()
-            elif choice == '8':
-                execute_custom_query()
-            elif choice == '9':
-                show_statistics()
-            elif choice == '0':
-                print("\n再见！")
-                break
-            else:
-                print("\n无效的选择，请重试")
+            DISPATCH.get(choice, invalid_choice)()
         except Exception as e:
             print(f"\n发生错误: {e}")
 
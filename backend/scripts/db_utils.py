@@ -0,0 +1,30 @@
+"""
+Shared SQLite helpers for the database inspection scripts
+Connections tuned for reading; none of them change the database file on open
+"""
+
+import sqlite3
+from pathlib import Path
+
+# Read-tuned PRAGMAs: 256 MB mmap, 128 MB page cache, in-memory temp tables
+READ_PRAGMAS = """
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-131072;
+    PRAGMA temp_store=MEMORY;
+"""
+
+def ro_connect(path):
+    """Open a SQLite database read-only (diagnostics never write)"""
+    return sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+
+def open_db(path, query_only=False):
+    """Open a SQLite connection with the read-tuned PRAGMAs
+
+    query_only makes the connection refuse writes; leave it off for tools
+    that may create indexes on request.
+    """
+    conn = sqlite3.connect(path)
+    conn.executescript(READ_PRAGMAS)
+    if query_only:
+        conn.execute("PRAGMA query_only = 1")
+    return conn
@@ -5,10 +5,11 @@
 cd backend
 venv/Scripts/python.exe diagnose_conversation.py <username>
 """
-import sqlite3
 import sys
 from pathlib import Path
 
+from db_utils import ro_connect
+
 def diagnose_conversations(username="testuser"):
     """诊断对话隔离问题"""
 
@@ -25,7 +26,7 @@ def diagnose_conversations(username="testuser"):
         print(f"❌ 用户数据库不存在: {users_db}")
         return
 
-    conn_users = sqlite3.connect(users_db)
+    conn_users = ro_connect(users_db)
     cursor_users = conn_users.cursor()
 
     # 获取用户ID
@@ -41,21 +42,18 @@ def diagnose_conversations(username="testuser"):
     # 检查对话
     print("Conversations:")
     cursor_users.execute("""
-        SELECT id, title, created_at, updated_at
-        FROM conversations
-        WHERE user_id = ?
-        ORDER BY created_at DESC
+        SELECT c.id, c.title, c.created_at, c.updated_at,
+               (SELECT COUNT(*) FROM messages m WHERE m.conversation_id = c.id)
+        FROM conversations c
+        WHERE c.user_id = ?
+        ORDER BY c.created_at DESC
     """, (user_id,))
 
     conversations = cursor_users.fetchall()
     if not conversations:
         print("  没有找到对话\n")
     else:
-        for conv_id, title, created, updated in conversations:
-            cursor_users.execute("""
-                SELECT COUNT(*) FROM messages WHERE conversation_id = ?
-            """, (conv_id,))
-            msg_count = cursor_users.fetchone()[0]
+        for conv_id, title, created, updated, msg_count in conversations:
             print(f"  - ID {conv_id}: {title}")
             print(f"    消息数: {msg_count}")
             print(f"    创建时间: {created}")
@@ -89,36 +87,33 @@ def diagnose_conversations(username="testuser"):
         print("   (如果没有上传过文件，这是正常的)\n")
         return
 
-    conn_rag = sqlite3.connect(rag_db)
+    conn_rag = ro_connect(rag_db)
+    # 附加users.db，在同一条查询中完成user_documents匹配检查
+    conn_rag.execute("ATTACH DATABASE ? AS udb", (f"{Path(users_db).resolve().as_uri()}?mode=ro",))
     cursor_rag = conn_rag.cursor()
 
     print(f"🔍 RAG数据库分析 ({rag_db}):")
 
     # 检查所有conversation_id
     cursor_rag.execute("""
-        SELECT conversation_id, COUNT(*) as chunk_count
-        FROM chunks
-        GROUP BY conversation_id
-        ORDER BY conversation_id
-    """)
+        SELECT c.conversation_id, COUNT(*) as chunk_count,
+               (SELECT COUNT(*) FROM udb.user_documents ud
+                WHERE ud.user_id = ? AND ud.conversation_id = c.conversation_id) as doc_count
+        FROM chunks c
+        GROUP BY c.conversation_id
+        ORDER BY c.conversation_id
+    """, (user_id,))
 
     rag_conversations = cursor_rag.fetchall()
     if not rag_conversations:
         print("  没有找到chunks\n")
     else:
         print("\n  按对话ID分组的chunks数量:")
-        for conv_id, count in rag_conversations:
+        for conv_id, count, doc_count in rag_conversations:
             if conv_id is None:
                 print(f"  ❌ NULL (未绑定对话): {count} chunks")
             else:
                 # 检查是否匹配user_documents中的conversation_id
-                cursor_users = sqlite3.connect(users_db).cursor()
-                cursor_users.execute("""
-                    SELECT COUNT(*) FROM user_documents
-                    WHERE user_id = ? AND conversation_id = ?
-                """, (user_id, conv_id))
-                doc_count = cursor_users.fetchone()[0]
-
                 match_status = "✓ 匹配" if doc_count > 0 else "⚠️  未匹配user_documents"
                 print(f"  - 对话 {conv_id}: {count} chunks ({match_status})")
         print()
@@ -142,13 +137,16 @@ def diagnose_conversations(username="testuser"):
         """)
         null_docs = cursor_rag.fetchall()
         if null_docs:
+            doc_ids = [doc_id for doc_id, _ in null_docs]
+            placeholders = ",".join("?" * len(doc_ids))
+            cursor_rag.execute(
+                f"SELECT id, filename FROM documents WHERE id IN ({placeholders})", doc_ids
+            )
+            filenames = dict(cursor_rag.fetchall())
+
             print("   来源文档:")
             for doc_id, count in null_docs:
-                cursor_rag.execute("""
-                    SELECT filename FROM documents WHERE id = ?
-                """, (doc_id,))
-                filename_row = cursor_rag.fetchone()
-                filename = filename_row[0] if filename_row else "未知"
+                filename = filenames.get(doc_id, "未知")
                 print(f"   - 文档ID {doc_id} ({filename}): {count} chunks")
             print()
 
@@ -1,10 +1,11 @@
 """
 Simple diagnostic script for conversation isolation
 """
-import sqlite3
 import sys
 from pathlib import Path
 
+from db_utils import ro_connect
+
 def diagnose(username):
     print("\n" + "="*60)
     print(f"Diagnosing user: {username}")
@@ -19,7 +20,7 @@ def diagnose(username):
         return
 
     # Get user ID
-    conn = sqlite3.connect(users_db)
+    conn = ro_connect(users_db)
     cursor = conn.cursor()
 
     cursor.execute("SELECT id FROM users WHERE username = ?", (username,))
@@ -38,10 +39,11 @@ def diagnose(username):
     print("="*60)
 
     cursor.execute("""
-        SELECT id, title, created_at, updated_at
-        FROM conversations
-        WHERE user_id = ?
-        ORDER BY created_at DESC
+        SELECT c.id, c.title, c.created_at, c.updated_at,
+               (SELECT COUNT(*) FROM messages m WHERE m.conversation_id = c.id)
+        FROM conversations c
+        WHERE c.user_id = ?
+        ORDER BY c.created_at DESC
     """, (user_id,))
 
     conversations = cursor.fetchall()
@@ -49,12 +51,7 @@ def diagnose(username):
     if not conversations:
         print("No conversations found\n")
     else:
-        for conv_id, title, created, updated in conversations:
-            cursor.execute("""
-                SELECT COUNT(*) FROM messages WHERE conversation_id = ?
-            """, (conv_id,))
-            msg_count = cursor.fetchone()[0]
-
+        for conv_id, title, created, updated, msg_count in conversations:
             print(f"Conversation ID: {conv_id}")
             print(f"  Title: {title}")
             print(f"  Messages: {msg_count}")
@@ -99,7 +96,7 @@ def diagnose(username):
     print(f"RAG DATABASE: {rag_db}")
     print("="*60)
 
-    conn_rag = sqlite3.connect(rag_db)
+    conn_rag = ro_connect(rag_db)
     cursor_rag = conn_rag.cursor()
 
     # Check chunks by conversation_id
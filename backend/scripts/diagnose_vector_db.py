@@ -2,11 +2,12 @@
 向量数据库诊断工具 - 深度排查文档检索问题
 
 使用方法:
-    python diagnose_vector_db.py <username> [conversation_id]
+    python diagnose_vector_db.py <username> [conversation_id] [--index]
 
 示例:
     python diagnose_vector_db.py tomyb
     python diagnose_vector_db.py tomyb 123
+    python diagnose_vector_db.py tomyb --index   # 先为 chunks 创建分组索引
 """
 import sqlite3
 import sys
@@ -15,13 +16,59 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+from db_utils import open_db
+
+try:
+    import orjson
+except ImportError:  # 可选依赖, 缺失时使用标准库 json
+    orjson = None
+
+
 class VectorDBDiagnostics:
-    def __init__(self, username):
+    def __init__(self, username, create_index=False):
         self.username = username
+        self.create_index = create_index
         self.vector_db_path = f"custom_rag_{username}.db"
         self.users_db_path = "users.db"
         self.issues_found = []
         self.warnings = []
+        # {表名: {字段名: 类型}}, 由 check_schema 填充供后续步骤复用
+        self.columns = {}
+        # {数据库路径: 连接}, 各诊断步骤共享同一连接
+        self._connections = {}
+
+    def _conn(self, db_path):
+        """获取指定数据库的共享连接 (首次使用时打开)"""
+        if db_path not in self._connections:
+            self._connections[db_path] = open_db(db_path)
+        return self._connections[db_path]
+
+    def _prepare_db(self, conn):
+        """在单个事务中创建诊断用索引并更新统计信息 (可重复执行)"""
+        # 只有 --index 才写库, 也只在此时切换到 WAL; 后端正在读写时切换会失败, 不影响诊断
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  无法切换到 WAL 模式: {e}")
+        try:
+            conn.executescript("""
+                BEGIN;
+                CREATE INDEX IF NOT EXISTS idx_chunks_conv ON chunks(conversation_id, chunk_index);
+                CREATE INDEX IF NOT EXISTS idx_chunks_conv_doc ON chunks(conversation_id, document_id);
+                ANALYZE chunks;
+                COMMIT;
+            """)
+        except sqlite3.OperationalError as e:
+            # 索引只影响速度, 建不成时继续诊断
+            if conn.in_transaction:
+                conn.rollback()
+            print(f"⚠️  无法创建诊断索引, 继续诊断: {e}")
+
+    def close(self):
+        """关闭所有已打开的数据库连接"""
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
 
     def check_db_exists(self):
         """检查数据库文件是否存在"""
@@ -53,44 +100,33 @@ class VectorDBDiagnostics:
         print("🏗️  检查数据库表结构")
         print("="*60)
 
-        # 检查向量数据库
-        conn = sqlite3.connect(self.vector_db_path)
-        cursor = conn.cursor()
-
-        # 检查 chunks 表是否有 conversation_id
-        cursor.execute("PRAGMA table_info(chunks)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
+        for db_path, table in ((self.vector_db_path, 'chunks'),
+                               (self.users_db_path, 'user_documents')):
+            conn = self._conn(db_path)
+            cursor = conn.cursor()
 
-        print(f"\n📋 chunks 表字段:")
-        for col, dtype in columns.items():
-            print(f"   - {col}: {dtype}")
-
-        if 'conversation_id' not in columns:
-            self.issues_found.append("❌ chunks 表缺少 conversation_id 字段!")
-            print("\n❌ 缺少 conversation_id 字段 - 需要运行迁移脚本!")
-        else:
-            print("\n✅ conversation_id 字段存在")
-
-        conn.close()
-
-        # 检查用户数据库
-        conn = sqlite3.connect(self.users_db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("PRAGMA table_info(user_documents)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
+            # 一次查询确认表是否存在, 仅对存在的表读取字段
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,)
+            )
+            if cursor.fetchone():
+                cursor.execute(f"PRAGMA table_xinfo({table})")
+                columns = {row[1]: row[2] for row in cursor.fetchall()}
+            else:
+                columns = {}
 
-        print(f"\n📋 user_documents 表字段:")
-        for col, dtype in columns.items():
-            print(f"   - {col}: {dtype}")
+            self.columns[table] = columns
 
-        if 'conversation_id' not in columns:
-            self.issues_found.append("❌ user_documents 表缺少 conversation_id 字段!")
-            print("\n❌ 缺少 conversation_id 字段 - 需要运行迁移脚本!")
-        else:
-            print("\n✅ conversation_id 字段存在")
+            print(f"\n📋 {table} 表字段:")
+            for col, dtype in columns.items():
+                print(f"   - {col}: {dtype}")
 
-        conn.close()
+            if 'conversation_id' not in columns:
+                self.issues_found.append(f"❌ {table} 表缺少 conversation_id 字段!")
+                print("\n❌ 缺少 conversation_id 字段 - 需要运行迁移脚本!")
+            else:
+                print("\n✅ conversation_id 字段存在")
 
     def analyze_chunks_distribution(self):
         """分析 chunks 的分布情况"""
@@ -98,7 +134,7 @@ class VectorDBDiagnostics:
         print("📊 分析文档块 (chunks) 分布")
         print("="*60)
 
-        conn = sqlite3.connect(self.vector_db_path)
+        conn = self._conn(self.vector_db_path)
         cursor = conn.cursor()
 
         # 总块数
@@ -109,9 +145,12 @@ class VectorDBDiagnostics:
         if total_chunks == 0:
             self.warnings.append("⚠️  向量数据库中没有任何文档块!")
             print("⚠️  向量数据库为空!")
-            conn.close()
             return
 
+        # 按 (conversation_id, chunk_index) 建索引后, GROUP BY 与 MIN/MAX 可直接走索引
+        if self.create_index:
+            self._prepare_db(conn)
+
         # 按 conversation_id 分组统计
         cursor.execute("""
             SELECT
@@ -145,15 +184,13 @@ class VectorDBDiagnostics:
             print(f"\n⚠️  发现 {null_conversation_chunks} 个旧块未绑定到任何对话")
             print("   这些块会在所有搜索中出现,可能导致污染!")
 
-        conn.close()
-
     def analyze_documents(self):
         """分析文档记录"""
         print("\n" + "="*60)
         print("📄 分析用户文档记录")
         print("="*60)
 
-        conn = sqlite3.connect(self.users_db_path)
+        conn = self._conn(self.users_db_path)
         cursor = conn.cursor()
 
         # 获取用户ID
@@ -161,7 +198,6 @@ class VectorDBDiagnostics:
         user_row = cursor.fetchone()
         if not user_row:
             print(f"❌ 用户不存在: {self.username}")
-            conn.close()
             return
 
         user_id = user_row[0]
@@ -181,7 +217,6 @@ class VectorDBDiagnostics:
 
         if not docs:
             print("\n⚠️  该用户没有上传任何文档!")
-            conn.close()
             return
 
         print(f"\n文档总数: {len(docs)}")
@@ -202,29 +237,36 @@ class VectorDBDiagnostics:
                 f"⚠️  发现 {null_conversation_docs} 个文档未绑定到对话"
             )
 
-        conn.close()
-
     def test_search_query(self, conversation_id=None):
         """模拟搜索查询,检查SQL执行"""
         print("\n" + "="*60)
         print("🔍 模拟搜索查询")
         print("="*60)
 
-        conn = sqlite3.connect(self.vector_db_path)
+        conn = self._conn(self.vector_db_path)
         cursor = conn.cursor()
 
+        has_conversation_id = 'conversation_id' in self.columns.get('chunks', {'conversation_id': None})
+
+        if not has_conversation_id:
+            print("\n⚠️  chunks 表缺少 conversation_id 字段, 跳过搜索模拟")
+            return
+
         if conversation_id:
             print(f"\n搜索范围: 对话 #{conversation_id}")
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM chunks
-                WHERE conversation_id = ? OR conversation_id IS NULL
-            """, (conversation_id,))
         else:
             print(f"\n搜索范围: 所有文档 (无会话过滤)")
-            cursor.execute("SELECT COUNT(*) FROM chunks")
 
-        count = cursor.fetchone()[0]
+        # 一次扫描同时得到可搜索块数与未绑定块数
+        cursor.execute("""
+            SELECT
+                COUNT(CASE WHEN :conv IS NULL OR conversation_id = :conv
+                                OR conversation_id IS NULL THEN 1 END),
+                COUNT(CASE WHEN conversation_id IS NULL THEN 1 END)
+            FROM chunks
+        """, {"conv": conversation_id or None})
+        count, null_count = cursor.fetchone()
+
         print(f"可搜索的块数量: {count}")
 
         if count == 0:
@@ -233,29 +275,27 @@ class VectorDBDiagnostics:
             )
             print(f"❌ 该对话没有文档!")
 
-        # 检查是否有 NULL conversation_id 的块
-        cursor.execute("SELECT COUNT(*) FROM chunks WHERE conversation_id IS NULL")
-        null_count = cursor.fetchone()[0]
-
         if null_count > 0:
             print(f"\n⚠️  警告: 发现 {null_count} 个未绑定对话的块")
             print(f"   这些块会在所有搜索中出现,可能是旧数据污染源!")
 
             # 显示未绑定块的来源文档
+            # 先在 chunks 中取最多5个来源文档ID, 扫描到5个即可停止
             cursor.execute("""
-                SELECT DISTINCT d.filename
-                FROM chunks c
-                JOIN documents d ON c.document_id = d.id
-                WHERE c.conversation_id IS NULL
-                LIMIT 5
+                SELECT filename
+                FROM documents
+                WHERE id IN (
+                    SELECT DISTINCT document_id
+                    FROM chunks
+                    WHERE conversation_id IS NULL
+                    LIMIT 5
+                )
             """)
 
             print("\n   未绑定块的来源文档:")
             for row in cursor.fetchall():
                 print(f"   - {row[0]}")
 
-        conn.close()
-
     def check_embedding_cache(self):
         """检查嵌入缓存状态"""
         print("\n" + "="*60)
@@ -336,12 +376,15 @@ class VectorDBDiagnostics:
             print("\n❌ 数据库文件缺失,无法继续诊断")
             return
 
-        self.check_schema()
-        self.analyze_chunks_distribution()
-        self.analyze_documents()
-        self.test_search_query(conversation_id)
-        self.check_embedding_cache()
-        self.suggest_fixes()
+        try:
+            self.check_schema()
+            self.analyze_chunks_distribution()
+            self.analyze_documents()
+            self.test_search_query(conversation_id)
+            self.check_embedding_cache()
+            self.suggest_fixes()
+        finally:
+            self.close()
 
         # 生成诊断报告
         report = {
@@ -353,8 +396,12 @@ class VectorDBDiagnostics:
         }
 
         report_file = f"diagnosis_report_{self.username}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
 
         print("\n" + "="*60)
         print(f"📋 诊断报告已保存: {report_file}")
@@ -362,14 +409,18 @@ class VectorDBDiagnostics:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("使用方法: python diagnose_vector_db.py <username> [conversation_id]")
+    args = [arg for arg in sys.argv[1:] if arg != "--index"]
+    create_index = "--index" in sys.argv[1:]
+
+    if len(args) < 1:
+        print("使用方法: python diagnose_vector_db.py <username> [conversation_id] [--index]")
         print("示例: python diagnose_vector_db.py tomyb")
         print("示例: python diagnose_vector_db.py tomyb 123")
+        print("示例: python diagnose_vector_db.py tomyb --index")
         sys.exit(1)
 
-    username = sys.argv[1]
-    conversation_id = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    username = args[0]
+    conversation_id = int(args[1]) if len(args) > 1 else None
 
-    diagnostics = VectorDBDiagnostics(username)
+    diagnostics = VectorDBDiagnostics(username, create_index=create_index)
     diagnostics.run_full_diagnosis(conversation_id)
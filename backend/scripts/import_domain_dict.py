@@ -5,10 +5,25 @@
 转换为我们的知识库格式,大幅扩展术语覆盖范围。
 """
 
+import csv
+import heapq
+import json
 import os
+import re
+from operator import itemgetter
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+try:
+    import pandas as pd
+except ImportError:  # 可选依赖, 缺失时逐行解析
+    pd = None
+
+try:
+    import orjson
+except ImportError:  # 可选依赖, 缺失时使用标准库 json
+    orjson = None
+
 # DomainWordsDict路径
 DOMAIN_DICT_PATH = r"C:\Users\tomyb\Downloads\DomainWordsDict-master\DomainWordsDict-master\data"
 
@@ -27,6 +42,35 @@ TECH_DOMAINS = {
 # 最小权重阈值 (只提取高权重词汇)
 MIN_WEIGHT_THRESHOLD = 10
 
+# 无意义词列表
+STOPWORDS = frozenset({
+    '的', '了', '和', '是', '在', '有', '与', '等', '及', '或',
+    '用', '为', '以', '对', '于', '由', '从', '到', '将', '被'
+})
+
+# 领域名称 -> 术语分类
+CATEGORY_MAP = {
+    '计算机业': '计算机科学',
+    '网络游戏': '网络技术',
+    '电子工程': '电子工程',
+    '通信工程': '通信工程',
+    '化学化工': '化学',
+    '物理科学': '物理',
+    '数学科学': '数学',
+    '医药医学': '医学',
+}
+
+# 定义生成规则: (关键词模式, 定义模板), 按顺序匹配
+DEFINITION_RULES = [
+    (re.compile('算法'), '{term}是一种计算算法或技术方法'),
+    (re.compile('网络|Net|net'), '{term}是一种网络技术或架构'),
+    (re.compile('数据|Data|data'), '{term}是数据处理或存储相关的技术概念'),
+    (re.compile('系统|System|system'), '{term}是一种系统架构或技术体系'),
+]
+
+# 特殊字符: 非字母数字且不在 - _ . / + 之中 (\w 即 isalnum() 加下划线)
+SPECIAL_CHAR_RE = re.compile(r'[^\w\-./+]')
+
 
 def load_domain_dict(domain_name: str, min_weight: int = 10) -> List[Tuple[str, int]]:
     """
@@ -45,6 +89,18 @@ def load_domain_dict(domain_name: str, min_weight: int = 10) -> List[Tuple[str,
         print(f"[!] 文件不存在: {file_path}")
         return []
 
+    if pd is not None:
+        # C解析器一次读入整个文件, 权重过滤使用向量化比较
+        df = pd.read_csv(
+            file_path, sep='\t', header=None, names=['term', 'weight'],
+            dtype={'term': str}, quoting=csv.QUOTE_NONE, keep_default_na=False,
+            on_bad_lines='skip', encoding='utf-8', engine='c'
+        )
+        weights = pd.to_numeric(df['weight'], errors='coerce')
+        mask = weights >= min_weight
+        return list(zip(df.loc[mask, 'term'].str.strip().tolist(),
+                        weights[mask].astype(int).tolist()))
+
     terms = []
     with open(file_path, 'r', encoding='utf-8') as f:
         for line in f:
@@ -77,12 +133,6 @@ def filter_tech_terms(terms: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
     """
     filtered = []
 
-    # 无意义词列表
-    stopwords = {
-        '的', '了', '和', '是', '在', '有', '与', '等', '及', '或',
-        '用', '为', '以', '对', '于', '由', '从', '到', '将', '被'
-    }
-
     for term, weight in terms:
         # 1. 长度检查
         if len(term) < 2 or len(term) > 15:
@@ -93,12 +143,11 @@ def filter_tech_terms(terms: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
             continue
 
         # 3. 跳过停用词
-        if term in stopwords:
+        if term in STOPWORDS:
             continue
 
         # 4. 跳过包含过多特殊字符的
-        special_char_count = sum(1 for c in term if not c.isalnum() and c not in ['-', '_', '.', '/', '+'])
-        if special_char_count > 2:
+        if len(SPECIAL_CHAR_RE.findall(term)) > 2:
             continue
 
         filtered.append((term, weight))
@@ -110,34 +159,18 @@ def categorize_terms(domain_name: str) -> str:
     """
     根据领域名称返回术语分类
     """
-    category_map = {
-        '计算机业': '计算机科学',
-        '网络游戏': '网络技术',
-        '电子工程': '电子工程',
-        '通信工程': '通信工程',
-        '化学化工': '化学',
-        '物理科学': '物理',
-        '数学科学': '数学',
-        '医药医学': '医学',
-    }
-    return category_map.get(domain_name, '专业术语')
+    return CATEGORY_MAP.get(domain_name, '专业术语')
 
 
 def generate_definition(term: str, category: str) -> str:
     """
     为术语生成定义
     """
-    # 简单规则生成定义
-    if '算法' in term:
-        return f'{term}是一种计算算法或技术方法'
-    elif any(x in term for x in ['网络', 'Net', 'net']):
-        return f'{term}是一种网络技术或架构'
-    elif any(x in term for x in ['数据', 'Data', 'data']):
-        return f'{term}是数据处理或存储相关的技术概念'
-    elif any(x in term for x in ['系统', 'System', 'system']):
-        return f'{term}是一种系统架构或技术体系'
-    else:
-        return f'{term}是{category}领域的专业术语'
+    # 简单规则生成定义, 命中第一条规则即返回
+    for pattern, template in DEFINITION_RULES:
+        if pattern.search(term):
+            return template.format(term=term)
+    return f'{term}是{category}领域的专业术语'
 
 
 def main():
@@ -164,8 +197,9 @@ def main():
         # 分类
         category = categorize_terms(domain_name)
 
-        # 存储
-        for term, weight in filtered[:500]:  # 每个领域最多取500个
+        # 存储: 每个领域最多取权重最高的500个 (有界堆, 无需全量排序)
+        top_terms = heapq.nlargest(500, filtered, key=itemgetter(1))
+        for term, weight in top_terms:
             all_tech_terms[category].append({
                 'term': term,
                 'weight': weight,
@@ -173,7 +207,7 @@ def main():
                 'definition': generate_definition(term, category)
             })
 
-        total_terms += min(len(filtered), 500)
+        total_terms += len(top_terms)
 
     # 输出统计
     print("\n" + "="*70)
@@ -185,41 +219,28 @@ def main():
 
     print(f"\n[OK] 总计提取: {total_terms} 个高质量技术术语")
 
-    # 生成Python代码格式的知识库
+    # 生成JSON格式的知识库 (由 app/utils/domain_knowledge_base.py 加载)
     print("\n" + "="*70)
-    print("生成知识库代码")
+    print("生成知识库数据")
     print("="*70)
 
-    output_file = "domain_knowledge_base.py"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('"""\n')
-        f.write('从DomainWordsDict提取的技术领域知识库\n')
-        f.write(f'总计 {total_terms} 个高质量技术术语\n')
-        f.write('"""\n\n')
-        f.write('DOMAIN_KNOWLEDGE_BASE = {\n')
-
-        for category in sorted(all_tech_terms.keys()):
-            terms = all_tech_terms[category]
-
-            # 按权重排序
-            terms_sorted = sorted(terms, key=lambda x: x['weight'], reverse=True)
-
-            for term_info in terms_sorted[:100]:  # 每个类别最多输出100个
-                term = term_info['term']
-                definition = term_info['definition']
-                category = term_info['category']
-
-                # 转义特殊字符
-                term_escaped = term.replace("'", "\\'")
-                definition_escaped = definition.replace("'", "\\'")
-
-                f.write(f"    '{term_escaped}': {{\n")
-                f.write(f"        'category': '{category}',\n")
-                f.write(f"        'definition': '{definition_escaped}',\n")
-                f.write(f"        'keywords': []\n")
-                f.write(f"    }},\n")
-
-        f.write('}\n')
+    knowledge_base = {}
+    for category in sorted(all_tech_terms.keys()):
+        # 每个类别按权重取前100个
+        for term_info in heapq.nlargest(100, all_tech_terms[category], key=itemgetter('weight')):
+            knowledge_base[term_info['term']] = {
+                'category': term_info['category'],
+                'definition': term_info['definition'],
+                'keywords': []
+            }
+
+    output_file = "domain_knowledge_base.json"
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(knowledge_base, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(knowledge_base, f, ensure_ascii=False, indent=2)
 
     print(f"[OK] 已生成: {output_file}")
     print(f"   包含最高权重的术语")
@@ -230,8 +251,8 @@ def main():
     print("="*70)
 
     if '计算机科学' in all_tech_terms:
-        computer_terms = sorted(all_tech_terms['计算机科学'], key=lambda x: x['weight'], reverse=True)
-        for i, term_info in enumerate(computer_terms[:20], 1):
+        computer_terms = heapq.nlargest(20, all_tech_terms['计算机科学'], key=itemgetter('weight'))
+        for i, term_info in enumerate(computer_terms, 1):
             print(f"{i:2}. {term_info['term']:20} (权重: {term_info['weight']})")
 
 
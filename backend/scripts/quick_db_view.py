@@ -1,12 +1,15 @@
 """
 Quick Database Viewer - 快速查看数据库内容
-Run: python quick_db_view.py
+Run: python quick_db_view.py [--index]
+     --index  first create the indexes used by the per-user counts (writes to the database)
 """
 import sqlite3
 import os
 import sys
 from tabulate import tabulate
 
+from db_utils import open_db
+
 # Fix Windows encoding issue
 if sys.platform == 'win32':
     import io
@@ -14,31 +17,45 @@ if sys.platform == 'win32':
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "users.db")
 
-def quick_view():
-    """Quick overview of database"""
+def create_indexes(conn):
+    """Create the indexes used by the per-user and per-conversation counts"""
+    try:
+        conn.executescript("""
+            BEGIN;
+            CREATE INDEX IF NOT EXISTS idx_conversations_updated_at ON conversations(user_id, updated_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_messages_conversation_id ON messages(conversation_id);
+            CREATE INDEX IF NOT EXISTS idx_user_documents_user_id ON user_documents(user_id);
+            COMMIT;
+        """)
+    except sqlite3.OperationalError as e:
+        if conn.in_transaction:
+            conn.rollback()
+        print(f"\n警告: 无法创建索引，统计可能较慢: {e}")
+
+def quick_view(create_index=False):
+    """Quick overview of database (read-only unless create_index is set)"""
     if not os.path.exists(DB_PATH):
         print(f"错误: 数据库文件不存在: {DB_PATH}")
         return
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db(DB_PATH)
     cursor = conn.cursor()
 
     print("\n" + "="*80)
     print("快速数据库概览 - RAG Chat 应用")
     print("="*80)
 
-    # Statistics
-    cursor.execute("SELECT COUNT(*) FROM users")
-    user_count = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM conversations")
-    conv_count = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM messages")
-    msg_count = cursor.fetchone()[0]
+    if create_index:
+        create_indexes(conn)
 
-    cursor.execute("SELECT COUNT(*) FROM user_documents")
-    doc_count = cursor.fetchone()[0]
+    # Statistics (one statement for all table counts)
+    cursor.execute("""
+        SELECT (SELECT COUNT(*) FROM users),
+               (SELECT COUNT(*) FROM conversations),
+               (SELECT COUNT(*) FROM messages),
+               (SELECT COUNT(*) FROM user_documents)
+    """)
+    user_count, conv_count, msg_count, doc_count = cursor.fetchone()
 
     print(f"\n📊 statistics:")
     print(f"  - 用户数: {user_count}")
@@ -50,13 +67,10 @@ def quick_view():
     print(f"\n👥 用户列表:")
     cursor.execute("""
         SELECT u.id, u.username, u.email,
-               COUNT(DISTINCT c.id) as conversations,
-               COUNT(DISTINCT d.id) as documents,
+               (SELECT COUNT(*) FROM conversations c WHERE c.user_id = u.id) as conversations,
+               (SELECT COUNT(*) FROM user_documents d WHERE d.user_id = u.id) as documents,
                u.created_at
         FROM users u
-        LEFT JOIN conversations c ON u.id = c.user_id
-        LEFT JOIN user_documents d ON u.id = d.user_id
-        GROUP BY u.id
         ORDER BY u.created_at DESC
     """)
     users = cursor.fetchall()
@@ -71,12 +85,10 @@ def quick_view():
     print(f"\n💬 最近的对话:")
     cursor.execute("""
         SELECT c.id, u.username, c.title,
-               COUNT(m.id) as msg_count,
+               (SELECT COUNT(*) FROM messages m WHERE m.conversation_id = c.id) as msg_count,
                c.updated_at
         FROM conversations c
         JOIN users u ON c.user_id = u.id
-        LEFT JOIN messages m ON c.id = m.conversation_id
-        GROUP BY c.id
         ORDER BY c.updated_at DESC
         LIMIT 10
     """)
@@ -101,4 +113,4 @@ def quick_view():
     conn.close()
 
 if __name__ == "__main__":
-    quick_view()
+    quick_view(create_index="--index" in sys.argv[1:])
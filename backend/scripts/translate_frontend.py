@@ -4,11 +4,16 @@ Translates all Chinese text in Vue components
 """
 
 import os
-import re
 import sys
 import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from translate_utils import (
+    build_translator, file_sha1, load_hash_cache, read_if_cjk,
+    save_hash_cache, translations_fingerprint, write_atomic,
+)
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -274,45 +279,43 @@ VUE_TRANSLATIONS = {
     "跳过": "Skip",
 }
 
+# Single-pass replacer over all keys (longest phrase wins)
+_translate = build_translator(VUE_TRANSLATIONS)
+
 def translate_vue_text(text):
     """Translate Chinese text to English in Vue files"""
-    result = text
-    # Sort by length (descending) to replace longer phrases first
-    for zh, en in sorted(VUE_TRANSLATIONS.items(), key=lambda x: len(x[0]), reverse=True):
-        # Replace in various contexts
-        # 1. Template strings: {{ text }}
-        result = re.sub(rf'{re.escape(zh)}(?=\s*}})', en, result)
-        # 2. String literals: "text" or 'text'
-        result = re.sub(rf'(["\']){re.escape(zh)}(["\'])', rf'\1{en}\2', result)
-        # 3. Attribute values: placeholder="text"
-        result = re.sub(rf'(placeholder\s*=\s*["\']){re.escape(zh)}(["\'])', rf'\1{en}\2', result)
-        result = re.sub(rf'(title\s*=\s*["\']){re.escape(zh)}(["\'])', rf'\1{en}\2', result)
-        result = re.sub(rf'(label\s*=\s*["\']){re.escape(zh)}(["\'])', rf'\1{en}\2', result)
-        # 4. Toast/message content
-        result = re.sub(rf'(message:\s*["\']){re.escape(zh)}(["\'])', rf'\1{en}\2', result)
-        result = re.sub(rf'(showMessage\(["\']){re.escape(zh)}(["\'])', rf'\1{en}\2', result)
-        # 5. Plain replacement for remaining cases
-        result = result.replace(zh, en)
-
-    return result
-
-def process_vue_file(file_path):
-    """Process a single Vue file"""
+    # Template strings, string literals, attribute values and message
+    # content all reduce to replacing the phrase itself, so one pass
+    # over the whole text covers every context
+    return _translate(text)
+
+# Content hashes of files already processed with the current VUE_TRANSLATIONS
+CACHE_PATH = Path(__file__).with_name(".translate_cache.json")
+
+def process_vue_file(file_path, cached_hash=None):
+    """Process a single Vue file
+
+    Returns (updated, content_hash). A file whose hash equals `cached_hash`
+    was handled by an earlier run and is skipped; content_hash is None on error.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content_hash = file_sha1(file_path)
+        if content_hash == cached_hash:
+            return False, content_hash
 
-        original_content = content
-        content = translate_vue_text(content)
+        original_content = read_if_cjk(file_path)
+        if original_content is None:
+            return False, content_hash
+
+        content = translate_vue_text(original_content)
 
         if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
+            write_atomic(file_path, content)
+            return True, file_sha1(file_path)
+        return False, content_hash
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
-        return False
+        return False, None
 
 def main():
     """Main function"""
@@ -323,23 +326,39 @@ def main():
         print(f"Error: Frontend src directory not found: {src_dir}")
         return
 
-    # Find all Vue, JS, TS files in src directory
+    # Find all Vue, JS, TS files in src directory in a single walk
     vue_files = []
-    for ext in ['*.vue', '*.js', '*.ts']:
-        vue_files.extend(src_dir.rglob(ext))
+    for root, dirs, files in os.walk(src_dir):
+        # Prune node_modules and dist so they are never descended into
+        dirs[:] = [d for d in dirs if d not in ('node_modules', 'dist', '.git', '__pycache__')]
 
-    # Exclude node_modules and dist
-    vue_files = [f for f in vue_files if 'node_modules' not in str(f) and 'dist' not in str(f)]
+        for file in files:
+            if file.endswith(('.vue', '.js', '.ts')):
+                vue_files.append(Path(root) / file)
 
     print(f"Found {len(vue_files)} frontend files to process...\n")
 
+    # Skip files whose content is unchanged since the last run
+    fingerprint = translations_fingerprint(VUE_TRANSLATIONS)
+    cache = load_hash_cache(CACHE_PATH, fingerprint)
+    rel_paths = [file_path.relative_to(src_dir).as_posix() for file_path in vue_files]
+    cached_hashes = [cache.get(rel_path) for rel_path in rel_paths]
+
+    # Files are independent, so translate them in parallel worker processes
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_vue_file, vue_files, cached_hashes, chunksize=16))
+
     updated_count = 0
-    for file_path in vue_files:
-        rel_path = file_path.relative_to(src_dir)
-        if process_vue_file(file_path):
+    new_cache = {}
+    for rel_path, (updated, content_hash) in zip(rel_paths, results):
+        if content_hash is not None:
+            new_cache[rel_path] = content_hash
+        if updated:
             print(f"  ✓ Updated: {rel_path}")
             updated_count += 1
 
+    save_hash_cache(CACHE_PATH, fingerprint, new_cache)
+
     print(f"\n{'='*60}")
     print(f"Frontend translation complete:")
     print(f"  {updated_count}/{len(vue_files)} files updated")
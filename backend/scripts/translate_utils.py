@@ -0,0 +1,145 @@
+"""
+Shared helpers for the translate_* scripts
+Builds single-pass multi-phrase replacers over a translation dictionary
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+
+try:
+    import ahocorasick
+except ImportError:  # optional, falls back to a regex alternation
+    ahocorasick = None
+
+# Any CJK ideograph; text without one has nothing to translate
+_CJK = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf]')
+
+def contains_cjk(text):
+    """Cheap prescreen run before the full replacement pass"""
+    return _CJK.search(text) is not None
+
+# Read size for the streaming CJK scan
+CHUNK_SIZE = 64 * 1024
+
+def read_if_cjk(path):
+    """Return the file's text if it contains CJK, otherwise None
+
+    Scans CHUNK_SIZE characters at a time and stops at the first hit, so
+    files with nothing to translate are never read into memory whole.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), ''):
+            if contains_cjk(chunk):
+                f.seek(0)
+                return f.read()
+    return None
+
+def write_atomic(path, content):
+    """Write through a sibling temp file so an interrupted run never truncates `path`"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def file_sha1(path):
+    """SHA-1 hex digest of a file's bytes, read in chunks"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def translations_fingerprint(translations):
+    """Hash of a translation dict; cached results are only valid for the same dict"""
+    data = json.dumps(translations, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+def load_hash_cache(cache_path, fingerprint):
+    """Load the {relative path: sha1} cache, or {} if missing, corrupt or stale"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('translations') != fingerprint:
+        return {}
+    return cache.get('files', {})
+
+def save_hash_cache(cache_path, fingerprint, files):
+    """Persist the hash cache atomically"""
+    data = {'translations': fingerprint, 'files': files}
+    write_atomic(cache_path, json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True))
+
+def translation_table(pairs):
+    """Build a translation dict from (zh, en) pairs, rejecting duplicate keys"""
+    table = {}
+    for zh, en in pairs:
+        if zh in table:
+            raise ValueError(f"Duplicate translation key: {zh!r}")
+        table[zh] = en
+    return table
+
+def build_translator(translations):
+    """Return a function replacing every key of `translations` in one scan
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and a
+    longest-first regex alternation otherwise. Both keep the leftmost,
+    longest non-overlapping matches.
+
+    Single-character keys that never occur inside a longer key are applied
+    first with str.translate, which is cheaper than matching them.
+    """
+    char_table = {
+        ord(zh): en for zh, en in translations.items()
+        if len(zh) == 1 and not any(zh in key for key in translations if len(key) > 1)
+    }
+    phrases = {zh: en for zh, en in translations.items() if len(zh) != 1 or ord(zh) not in char_table}
+    replace_phrases = _build_phrase_replacer(phrases)
+
+    if not char_table:
+        return replace_phrases
+    if not phrases:
+        return lambda text: text.translate(char_table)
+    return lambda text: replace_phrases(text.translate(char_table))
+
+def _build_phrase_replacer(translations):
+    """Leftmost-longest replacement of the keys of `translations`"""
+    if ahocorasick is None:
+        pattern = re.compile('|'.join(
+            re.escape(zh) for zh in sorted(translations, key=len, reverse=True)
+        ))
+        return lambda text: pattern.sub(lambda m: translations[m.group(0)], text)
+
+    automaton = ahocorasick.Automaton()
+    for zh, en in translations.items():
+        automaton.add_word(zh, (len(zh), en))
+    automaton.make_automaton()
+
+    def translate(text):
+        # Collect every match, then keep the leftmost-longest non-overlapping ones
+        matches = sorted(
+            (end - length + 1, -length, en)
+            for end, (length, en) in automaton.iter(text)
+        )
+        parts = []
+        pos = 0
+        for start, neg_length, en in matches:
+            if start < pos:
+                continue
+            parts.append(text[pos:start])
+            parts.append(en)
+            pos = start - neg_length
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    return translate
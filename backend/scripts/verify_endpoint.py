@@ -3,6 +3,7 @@ Verify /api/extract-terms endpoint exists
 """
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8000"
 
@@ -13,6 +14,17 @@ def test_endpoint_exists():
     print("Verifying /api/extract-terms endpoint")
     print("=" * 60)
 
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        run_probes(executor)
+
+    print("\n" + "=" * 60)
+
+def run_probes(executor):
+    """Health check first, then the independent probes concurrently
+
+    requests.Session is not thread-safe, so each probe uses the module-level
+    requests.get/post, which open and close a session of their own.
+    """
     # Test 1: Health check
     print("\n[Test 1/3] Health check...")
     try:
@@ -26,14 +38,21 @@ def test_endpoint_exists():
         print(f"  [FAIL] Cannot connect to backend: {e}")
         return
 
+    # Tests 2 and 3 don't depend on each other; issue all their requests
+    # at once and report the results in order
+    extract_future = executor.submit(
+        requests.post,
+        f"{BASE_URL}/api/extract-terms",
+        json={"content": "test", "use_ai": True},
+        timeout=5
+    )
+    docs_future = executor.submit(requests.get, f"{BASE_URL}/docs", timeout=5)
+    openapi_future = executor.submit(requests.get, f"{BASE_URL}/openapi.json", timeout=5)
+
     # Test 2: Try extract-terms without auth (should get 401 or 422, NOT 404)
     print("\n[Test 2/3] Test endpoint existence (without auth)...")
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/extract-terms",
-            json={"content": "test", "use_ai": True},
-            timeout=5
-        )
+        response = extract_future.result()
 
         print(f"  Status Code: {response.status_code}")
 
@@ -58,13 +77,13 @@ def test_endpoint_exists():
     print("\n[Test 3/3] Check registered routes...")
     try:
         # Try OpenAPI docs endpoint
-        response = requests.get(f"{BASE_URL}/docs", timeout=5)
+        response = docs_future.result()
         if response.status_code == 200:
             print("  [OK] OpenAPI docs available at http://localhost:8000/docs")
             print("  -> Open this URL in browser to see all endpoints")
 
         # Try to access OpenAPI JSON
-        response = requests.get(f"{BASE_URL}/openapi.json", timeout=5)
+        response = openapi_future.result()
         if response.status_code == 200:
             openapi_data = response.json()
             paths = openapi_data.get("paths", {})
@@ -87,7 +106,5 @@ def test_endpoint_exists():
     except Exception as e:
         print(f"  [FAIL] Cannot access OpenAPI: {e}")
 
-    print("\n" + "=" * 60)
-
 if __name__ == "__main__":
     test_endpoint_exists()
@@ -5,11 +5,10 @@ Tests: Login, Register, Dashboard, Chat functionality
 import sys
 import os
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from faker import Faker
-import time
 import logging
 
 # Add parent directory to path
@@ -22,95 +21,99 @@ from e2e.page_objects.register_page import RegisterPage
 from e2e.page_objects.dashboard_page import DashboardPage
 
 # Setup logging
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Banners are noise once the log is quieted (e.g. LOG_LEVEL=WARNING on CI)
+BANNER_LEVEL = logging.INFO if logging.getLevelName(LOG_LEVEL) == logging.INFO else logging.DEBUG
+
 # Initialize Faker for test data
 fake = Faker()
 
 
+def _banner(*lines):
+    """Log a section banner as a single record"""
+    if logger.isEnabledFor(BANNER_LEVEL):
+        rule = "=" * 80
+        logger.log(BANNER_LEVEL, "\n".join(["", rule, *lines, rule]))
+
+
 class TestVue3RAGApplication:
     """Comprehensive test suite for Vue3 RAG Application"""
 
-    @classmethod
-    def setup_class(cls):
-        """Setup test environment"""
-        logger.info("=" * 80)
-        logger.info("STARTING COMPREHENSIVE TEST SUITE")
-        logger.info("=" * 80)
-
-        # Initialize WebDriver
-        logger.info("Initializing Chrome WebDriver...")
-        service = Service(ChromeDriverManager().install())
-        options = config.get_browser_options()
-        cls.driver = webdriver.Chrome(service=service, options=options)
-
-        # Set timeouts
-        cls.driver.implicitly_wait(config.IMPLICIT_WAIT)
-        cls.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
-        cls.driver.maximize_window()
-
-        # Initialize page objects
-        cls.login_page = LoginPage(cls.driver, config)
-        cls.register_page = RegisterPage(cls.driver, config)
-        cls.dashboard_page = DashboardPage(cls.driver, config)
-
-        logger.info("Test environment initialized successfully")
-
-    @classmethod
-    def teardown_class(cls):
-        """Cleanup after tests"""
-        logger.info("\n" + "=" * 80)
-        logger.info("CLEANING UP TEST ENVIRONMENT")
-        logger.info("=" * 80)
-        time.sleep(3)
-        cls.driver.quit()
-        logger.info("Browser closed")
-
-    def test_01_login_page_loads(self):
-        """Test 1: Verify login page loads correctly"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 1: Login Page Load")
-        logger.info("=" * 80)
+    @pytest.fixture(autouse=True)
+    def _bind_driver(self, driver):
+        """Attach the worker's shared driver and fresh page objects to each test"""
+        self.driver = driver
+        self.login_page = LoginPage(driver, config)
+        self.register_page = RegisterPage(driver, config)
+        self.dashboard_page = DashboardPage(driver, config)
+
+    @pytest.mark.xdist_group("auth")
+    def test_login_register_flow(self):
+        """Tests 1, 2, 4, 8: walk login -> register -> login with a single page load"""
+        _banner("TEST: Login/Register Flow")
 
+        # 1. Login page loads
         self.login_page.navigate()
         current_url = self.driver.current_url
-
         logger.info(f"Current URL: {current_url}")
         assert "/login" in current_url or "/welcome" in current_url, "Failed to load login page"
-        logger.info("PASS: Login page loaded successfully")
-        time.sleep(2)
-
-    def test_02_login_with_empty_credentials(self):
-        """Test 2: Login with empty credentials should show validation"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 2: Login with Empty Credentials")
-        logger.info("=" * 80)
-
-        self.login_page.navigate()
 
-        # Try to login without entering credentials
+        # 2. Submitting empty credentials must not leave the login page
         try:
             self.login_page.click_login()
-            time.sleep(2)
+        except TimeoutException as e:
+            logger.info(f"Login button click prevented: {e}")
+        current_url = self.driver.current_url
+        assert "/login" in current_url or "/welcome" in current_url, "Unexpectedly navigated away from login"
+        logger.info("Empty credentials validation: OK")
 
-            # Should still be on login page
-            current_url = self.driver.current_url
-            assert "/login" in current_url or "/welcome" in current_url, "Unexpectedly navigated away from login"
-            logger.info("PASS: Empty credentials validation works")
-        except Exception as e:
-            logger.info(f"PASS: Login button click prevented or validation shown: {e}")
+        # 3. Form fields accept input
+        test_username = "test_user_interaction"
+        test_password = "test_password_123"
+        self.login_page.enter_username(test_username)
+        self.login_page.enter_password(test_password)
+        username_value, password_value = self.login_page.read_form_values()
+        assert username_value == test_username, "Username field did not accept input"
+        assert password_value == test_password, "Password field did not accept input"
+        logger.info("Login form field interactions: OK")
+
+        # 4. Register link leads to the register page
+        if self.driver.find_elements(*self.login_page.REGISTER_LINK):
+            self.login_page.click_register_link()
+            logger.info("Navigation to register: OK")
+        else:
+            logger.warning("Register navigation link not found, opening register page directly")
+            self.register_page.navigate()
+        assert "/register" in self.driver.current_url, "Failed to navigate to register"
 
-        time.sleep(2)
+        # 5. Register form fields accept input
+        register_username = fake.user_name()
+        test_email = fake.email()
+        username_field = self.register_page.enter_username(register_username)
+        email_value = self.register_page.enter_email(test_email).get_attribute("value")
+        assert username_field.get_attribute("value") == register_username, "Username field did not accept input"
+        assert email_value == test_email, "Email field did not accept input"
+        logger.info("Register form field interactions: OK")
+
+        # 6. Login link leads back
+        if self.driver.find_elements(*self.register_page.LOGIN_LINK):
+            self.register_page.click_login_link()
+            logger.info("Navigation to login: OK")
+        else:
+            logger.warning("Login navigation link not found")
 
+        logger.info("PASS: Login/register flow tested")
+
+    @pytest.mark.xdist_group("auth")
     def test_03_login_with_invalid_credentials(self):
         """Test 3: Login with invalid credentials"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 3: Login with Invalid Credentials")
-        logger.info("=" * 80)
+        _banner("TEST 3: Login with Invalid Credentials")
 
         self.login_page.navigate()
 
@@ -120,7 +123,6 @@ class TestVue3RAGApplication:
 
         logger.info(f"Testing with fake credentials: {fake_username}")
         self.login_page.login(fake_username, fake_password)
-        time.sleep(3)
 
         # Check if error message appears or still on login page
         current_url = self.driver.current_url
@@ -132,45 +134,11 @@ class TestVue3RAGApplication:
         # Should not be on dashboard
         assert "/dashboard" not in current_url, "Should not login with invalid credentials"
         logger.info("PASS: Invalid credentials rejected")
-        time.sleep(2)
-
-    def test_04_login_form_interaction(self):
-        """Test 4: Test login form field interactions"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 4: Login Form Field Interactions")
-        logger.info("=" * 80)
-
-        self.login_page.navigate()
-
-        test_username = "test_user_interaction"
-        test_password = "test_password_123"
-
-        # Test username field
-        try:
-            self.login_page.enter_username(test_username)
-            logger.info("Username field interaction: OK")
-            time.sleep(1)
-        except Exception as e:
-            logger.error(f"Username field interaction failed: {e}")
-            pytest.fail(f"Username field not accessible: {e}")
-
-        # Test password field
-        try:
-            self.login_page.enter_password(test_password)
-            logger.info("Password field interaction: OK")
-            time.sleep(1)
-        except Exception as e:
-            logger.error(f"Password field interaction failed: {e}")
-            pytest.fail(f"Password field not accessible: {e}")
-
-        logger.info("PASS: All form fields are interactive")
-        time.sleep(2)
 
+    @pytest.mark.smoke
     def test_05_register_page_loads(self):
         """Test 5: Verify register page loads"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 5: Register Page Load")
-        logger.info("=" * 80)
+        _banner("TEST 5: Register Page Load")
 
         self.register_page.navigate()
         current_url = self.driver.current_url
@@ -178,35 +146,27 @@ class TestVue3RAGApplication:
         logger.info(f"Current URL: {current_url}")
         assert "/register" in current_url, "Failed to load register page"
         logger.info("PASS: Register page loaded successfully")
-        time.sleep(2)
 
     def test_06_register_form_validation(self):
         """Test 6: Test register form validation"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 6: Register Form Validation")
-        logger.info("=" * 80)
+        _banner("TEST 6: Register Form Validation")
 
         self.register_page.navigate()
 
         # Try to register with empty form
         try:
             self.register_page.click_register()
-            time.sleep(2)
+        except TimeoutException as e:
+            logger.info(f"Register button click prevented: {e}")
 
-            # Should still be on register page
-            current_url = self.driver.current_url
-            assert "/register" in current_url, "Unexpectedly navigated away from register"
-            logger.info("PASS: Empty form validation works")
-        except Exception as e:
-            logger.info(f"PASS: Form validation or button click prevented: {e}")
-
-        time.sleep(2)
+        # Should still be on register page
+        current_url = self.driver.current_url
+        assert "/register" in current_url, "Unexpectedly navigated away from register"
+        logger.info("PASS: Empty form validation works")
 
     def test_07_register_form_fields(self):
         """Test 7: Test all register form fields"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 7: Register Form Field Interactions")
-        logger.info("=" * 80)
+        _banner("TEST 7: Register Form Field Interactions")
 
         self.register_page.navigate()
 
@@ -219,7 +179,6 @@ class TestVue3RAGApplication:
         try:
             self.register_page.enter_username(test_username)
             logger.info(f"Username field: OK - Entered {test_username}")
-            time.sleep(1)
         except Exception as e:
             logger.warning(f"Username field interaction issue: {e}")
 
@@ -227,7 +186,6 @@ class TestVue3RAGApplication:
         try:
             self.register_page.enter_email(test_email)
             logger.info(f"Email field: OK - Entered {test_email}")
-            time.sleep(1)
         except Exception as e:
             logger.warning(f"Email field interaction issue: {e}")
 
@@ -236,60 +194,24 @@ class TestVue3RAGApplication:
             sent = self.register_page.click_send_code()
             if sent:
                 logger.info("Send code button: OK - Clicked")
-            time.sleep(2)
         except Exception as e:
             logger.warning(f"Send code button issue: {e}")
 
         logger.info("PASS: Register form fields tested")
-        time.sleep(2)
-
-    def test_08_navigation_links(self):
-        """Test 8: Test navigation between login and register"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 8: Navigation Links")
-        logger.info("=" * 80)
-
-        # Start at login
-        self.login_page.navigate()
-        time.sleep(2)
-
-        # Try to find and click register link
-        try:
-            from selenium.webdriver.common.by import By
-            register_link = self.driver.find_element(By.CSS_SELECTOR, "a[href*='register']")
-            register_link.click()
-            time.sleep(3)
-
-            current_url = self.driver.current_url
-            assert "/register" in current_url, "Failed to navigate to register"
-            logger.info("Navigation to register: OK")
-        except Exception as e:
-            logger.warning(f"Register navigation link not found or clickable: {e}")
-
-        # Try to navigate back to login
-        try:
-            from selenium.webdriver.common.by import By
-            login_link = self.driver.find_element(By.CSS_SELECTOR, "a[href*='login']")
-            login_link.click()
-            time.sleep(3)
-
-            current_url = self.driver.current_url
-            assert "/login" in current_url or "/welcome" in current_url, "Failed to navigate to login"
-            logger.info("Navigation to login: OK")
-        except Exception as e:
-            logger.warning(f"Login navigation link not found or clickable: {e}")
-
-        logger.info("PASS: Navigation links tested")
-        time.sleep(2)
 
     def test_09_dashboard_direct_access(self):
         """Test 9: Try to access dashboard without login"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 9: Dashboard Access Without Login")
-        logger.info("=" * 80)
+        _banner("TEST 9: Dashboard Access Without Login")
 
         self.dashboard_page.navigate()
-        time.sleep(3)
+
+        # Give the router guard a moment to redirect away from the dashboard
+        try:
+            WebDriverWait(self.driver, 3, poll_frequency=config.POLL_FREQUENCY).until_not(
+                EC.url_contains("/dashboard")
+            )
+        except TimeoutException:
+            pass
 
         current_url = self.driver.current_url
         logger.info(f"Redirected to: {current_url}")
@@ -305,13 +227,10 @@ class TestVue3RAGApplication:
         else:
             logger.info(f"Redirected to: {current_url}")
 
-        time.sleep(2)
-
+    @pytest.mark.xdist_group("resize")
     def test_10_responsive_design(self):
         """Test 10: Test responsive design at different screen sizes"""
-        logger.info("\n" + "=" * 80)
-        logger.info("TEST 10: Responsive Design")
-        logger.info("=" * 80)
+        _banner("TEST 10: Responsive Design")
 
         sizes = [
             (1920, 1080, "Desktop"),
@@ -320,55 +239,52 @@ class TestVue3RAGApplication:
             (375, 667, "Mobile")
         ]
 
-        for width, height, device in sizes:
-            logger.info(f"Testing {device} size: {width}x{height}")
-
-            try:
-                # First set window state to normal (not maximized)
-                self.driver.set_window_rect(x=0, y=0, width=width, height=height)
-                time.sleep(2)
-            except Exception as e:
-                logger.warning(f"Could not set exact size for {device}: {e}")
-                # Try alternative method
-                try:
-                    self.driver.minimize_window()
-                    time.sleep(1)
-                    self.driver.set_window_size(width, height)
-                    time.sleep(2)
-                except Exception as e2:
-                    logger.warning(f"Alternative method also failed for {device}: {e2}")
-
-            self.login_page.navigate()
-            time.sleep(2)
-
-            logger.info(f"{device}: Page loaded successfully")
-
-        # Restore to default size
-        self.driver.maximize_window()
+        # Load the page once; viewport changes re-layout it in place
+        self.login_page.navigate()
+
+        try:
+            for width, height, device in sizes:
+                logger.info(f"Testing {device} size: {width}x{height}")
+
+                # Emulate the viewport in-process instead of resizing the OS window
+                self.driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                    "width": width,
+                    "height": height,
+                    "deviceScaleFactor": 1,
+                    "mobile": width < 500
+                })
+                viewport_width = self.driver.execute_script("return window.innerWidth")
+                visible = self.login_page.field_visibility_mask()
+
+                logger.info(f"{device}: Page rendered at viewport width {viewport_width}")
+                assert visible == LoginPage.ALL_FIELDS_VISIBLE, \
+                    f"Login form controls hidden at {width}x{height} (visibility mask {visible:03b})"
+        finally:
+            # Restore the default viewport for later tests on this driver
+            self.driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+
         logger.info("PASS: Responsive design tested")
-        time.sleep(2)
 
 
 def run_comprehensive_tests():
     """Run all tests"""
-    logger.info("\n" + "=" * 80)
-    logger.info("  COMPREHENSIVE SELENIUM TEST SUITE")
-    logger.info("  Vue3 RAG Application")
-    logger.info("=" * 80 + "\n")
+    _banner("  COMPREHENSIVE SELENIUM TEST SUITE", "  Vue3 RAG Application")
 
     print("\nIMPORTANT: Make sure your application is running:")
     print("  Frontend: http://localhost:5173")
     print("  Backend:  http://localhost:8000")
-    print("\nPress Ctrl+C to cancel, or wait 5 seconds to continue...")
 
     try:
-        time.sleep(5)
-
-        # Run pytest
+        # One Chrome per xdist worker; loadgroup keeps each xdist_group
+        # (auth flow, viewport resizing) together on one worker
         pytest.main([
             __file__,
             '-v',
-            '--tb=short'
+            '--tb=short',
+            # Report the ten slowest setups/tests to show where the time goes
+            '--durations=10',
+            '-n', '2',
+            '--dist=loadgroup'
         ])
 
     except KeyboardInterrupt:
@@ -0,0 +1,92 @@
+"""
+Shared pytest fixtures for the Selenium end-to-end suite
+"""
+import os
+import sys
+import logging
+from dataclasses import replace
+
+import pytest
+
+# Make the e2e package importable however pytest is invoked
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from e2e.config.test_config import config as test_config
+from e2e.driver_ctx import managed_driver
+from e2e.mock_driver import MockDriver
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--headed", action="store_true",
+        help="show the Chrome window (overrides the HEADLESS default) for local debugging"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "smoke: routing-only check that also runs against MockDriver (SMOKE_MODE=1)"
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """In SMOKE_MODE only tests marked smoke can run; the rest need a real browser"""
+    if not test_config.SMOKE_MODE:
+        return
+    skip_browser = pytest.mark.skip(reason="needs a real browser (SMOKE_MODE=1)")
+    for item in items:
+        if "smoke" not in item.keywords:
+            item.add_marker(skip_browser)
+
+
+def worker_id():
+    """pytest-xdist worker id (gw0, gw1, ...); gw0 when running serially"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+
+@pytest.fixture(scope="session")
+def driver(pytestconfig):
+    """One Chrome instance per xdist worker, shared by every test it runs"""
+    if test_config.SMOKE_MODE:
+        logger.info("SMOKE_MODE: using MockDriver instead of Chrome")
+        yield MockDriver()
+        return
+
+    logger.info(f"Initializing Chrome WebDriver for worker {worker_id()}...")
+    browser_config = replace(test_config, HEADLESS=False) if pytestconfig.getoption("--headed") else test_config
+    options = browser_config.get_browser_options()
+    # Persistent per-worker profile and disk cache, so the dev server's ES
+    # modules are revalidated (304) instead of refetched on every run.
+    # Chrome locks its profile directory, so every worker needs its own
+    profile_dir = os.path.join(test_config.CACHE_DIR, f"chrome-profile-{worker_id()}")
+    cache_dir = os.path.join(test_config.CACHE_DIR, f"chrome-cache-{worker_id()}")
+    options.add_argument(f"--user-data-dir={profile_dir}")
+    options.add_argument(f"--disk-cache-dir={cache_dir}")
+    options.add_argument(f"--disk-cache-size={test_config.DISK_CACHE_SIZE}")
+
+    with managed_driver(browser_config, options) as driver:
+        # Drop trackers, web fonts, images and HMR updates at the network layer
+        if browser_config.BLOCKED_URLS:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(browser_config.BLOCKED_URLS)})
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": 1})
+
+        yield driver
+
+
+@pytest.fixture(autouse=True)
+def reset_browser_state(request):
+    """Clear cookies and web storage so tests sharing one driver start clean"""
+    if "driver" in request.fixturenames:
+        driver = request.getfixturevalue("driver")
+        # Cookies and localStorage are cleared by origin over CDP, so this works
+        # from whatever page is loaded (including about:blank)
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": test_config.BASE_URL,
+            "storageTypes": "cookies,local_storage",
+        })
+        # CDP has no sessionStorage type; clear it in the page (throws on about:blank)
+        driver.execute_script("try { window.sessionStorage.clear(); } catch (e) {}")
+    yield
@@ -3,9 +3,43 @@ Test Environment Configuration
 """
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# Headless-only Chrome prefs: login/register pages are text-only
+HEADLESS_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+}
+
+
+@lru_cache(maxsize=None)
+def chrome_arguments(headless, width, height):
+    """Chrome command-line switches for one configuration, built once per process"""
+    args = []
+    if headless:
+        args.append('--headless=new')
+        # Skip images in headless runs
+        args.append('--blink-settings=imagesEnabled=false')
+    args += [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        # Background services only slow down startup
+        '--disable-extensions',
+        '--disable-background-networking',
+        '--disable-sync',
+        '--mute-audio',
+        '--disable-features=Translate,MediaRouter,OptimizationHints',
+        '--disable-renderer-backgrounding',
+        f'--window-size={width},{height}',
+        # Add options to see what's happening
+        '--start-maximized',
+    ]
+    return tuple(args)
+
+
+@dataclass(frozen=True, slots=True)
 class TestConfig:
     """Test configuration settings"""
 
@@ -20,32 +54,45 @@ class TestConfig:
 
     # Browser Settings
     BROWSER: str = 'chrome'  # chrome, firefox, edge
-    HEADLESS: bool = False  # Set to False to see the browser
+    HEADLESS: bool = os.environ.get('HEADLESS', '1') == '1'  # HEADLESS=0 to watch the browser
     WINDOW_SIZE: tuple = (1920, 1080)
+    # SMOKE_MODE=1: routing-only tests against MockDriver, no browser launched
+    SMOKE_MODE: bool = os.environ.get('SMOKE_MODE', '0') == '1'
+
+    # Persistent Chrome profiles/caches and the chromedriver path cache live here
+    CACHE_DIR: str = os.path.join(os.path.expanduser('~'), '.cache', 'documind')
+    DISK_CACHE_SIZE: int = 512 * 1024 * 1024
+
+    # URL patterns blocked through CDP; none of the tested pages need them.
+    # Set to () for tests that need to see images or fonts
+    BLOCKED_URLS: tuple = (
+        '*google-analytics*', '*googletagmanager*', '*/analytics*',
+        '*fonts.googleapis*', '*fonts.gstatic*', '*hotjar*', '*sentry*',
+        '*.woff2', '*.woff', '*.ttf', '*hot-update*',
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp',
+    )
 
     # Timeouts (seconds)
-    IMPLICIT_WAIT: int = 10
     EXPLICIT_WAIT: int = 20
+    # Explicit-wait retry step (WebDriverWait defaults to 0.5s)
+    POLL_FREQUENCY: float = 0.25
     PAGE_LOAD_TIMEOUT: int = 30
 
     # Screenshot Settings
     SCREENSHOT_ON_FAILURE: bool = True
     SCREENSHOT_DIR: str = 'tests/reports/screenshots'
 
-    @classmethod
-    def get_browser_options(cls):
-        """Get browser-specific options"""
-        if cls.BROWSER == 'chrome':
+    def get_browser_options(self):
+        """Get browser-specific options (a new object each call, so callers may extend it)"""
+        if self.BROWSER == 'chrome':
             from selenium.webdriver.chrome.options import Options
             options = Options()
-            if cls.HEADLESS:
-                options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument(f'--window-size={cls.WINDOW_SIZE[0]},{cls.WINDOW_SIZE[1]}')
-            # Add options to see what's happening
-            options.add_argument('--start-maximized')
+            # driver.get() returns at DOMContentLoaded instead of the load event
+            options.page_load_strategy = 'eager'
+            for arg in chrome_arguments(self.HEADLESS, *self.WINDOW_SIZE):
+                options.add_argument(arg)
+            if self.HEADLESS:
+                options.add_experimental_option('prefs', HEADLESS_PREFS)
             options.add_experimental_option('excludeSwitches', ['enable-logging'])
             return options
         return None
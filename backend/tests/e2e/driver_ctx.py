@@ -0,0 +1,51 @@
+"""
+Managed WebDriver - Chrome session that is always shut down, even if quit() hangs
+"""
+import logging
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from .driver_path import get_driver_path
+
+logger = logging.getLogger(__name__)
+
+
+def _quit(driver, timeout):
+    """Quit the driver, killing chromedriver if it does not exit within timeout seconds"""
+    def quit_quietly():
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"driver.quit() failed: {e}")
+
+    # A thread rather than signal.alarm: works on Windows and off the main thread
+    quitter = threading.Thread(target=quit_quietly, daemon=True)
+    quitter.start()
+    quitter.join(timeout)
+
+    process = driver.service.process
+    if process is not None and process.poll() is None:
+        logger.warning(f"chromedriver (pid {process.pid}) still running, killing it")
+        process.kill()
+
+
+@contextmanager
+def managed_driver(cfg, options=None, quit_timeout=10):
+    """Yield a configured Chrome WebDriver and guarantee chromedriver is gone afterwards
+
+    A leaked chromedriver keeps its executable locked and doubles the
+    startup cost of the next run.
+    """
+    service = Service(get_driver_path())
+    driver = webdriver.Chrome(service=service, options=options or cfg.get_browser_options())
+    try:
+        # Element lookups rely on explicit waits, not an implicit wait
+        driver.set_page_load_timeout(cfg.PAGE_LOAD_TIMEOUT)
+        driver.maximize_window()
+        yield driver
+    finally:
+        _quit(driver, quit_timeout)
+        logger.info("Browser closed")
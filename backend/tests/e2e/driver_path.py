@@ -0,0 +1,58 @@
+"""
+ChromeDriver Path Cache - skip webdriver_manager's network check while Chrome is unchanged
+"""
+import os
+import json
+import logging
+from functools import lru_cache
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+
+from .config.test_config import config
+
+logger = logging.getLogger(__name__)
+
+# {chrome_major_version: chromedriver_path}
+CACHE_FILE = os.path.join(config.CACHE_DIR, 'chromedriver.json')
+
+
+def get_chrome_major_version():
+    """Installed Chrome major version, or None if it cannot be detected"""
+    version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    return version.split('.')[0] if version else None
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    tmp_file = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    # Atomic, so parallel xdist workers never read a half-written file
+    os.replace(tmp_file, CACHE_FILE)
+
+
+@lru_cache(maxsize=None)
+def get_driver_path():
+    """ChromeDriver path, reused across runs until Chrome's major version changes"""
+    chrome_major = get_chrome_major_version()
+    cache = _load_cache()
+
+    path = cache.get(chrome_major) if chrome_major else None
+    if path and os.path.exists(path):
+        logger.info(f"Using cached ChromeDriver for Chrome {chrome_major}: {path}")
+        return path
+
+    path = ChromeDriverManager().install()
+    if chrome_major:
+        cache[chrome_major] = path
+        _save_cache(cache)
+    return path
@@ -0,0 +1,47 @@
+"""
+Mock WebDriver - browser-free stand-in used in SMOKE_MODE for routing-only checks
+"""
+from unittest.mock import MagicMock
+
+
+class MockDriver:
+    """Records navigation and answers the calls page objects make, without Chrome
+
+    find_element returns a MagicMock (so waits for presence/visibility succeed
+    immediately), find_elements returns nothing, and current_url is simply the
+    last URL passed to get().
+    """
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.title = ""
+        self.visited = []
+
+    def get(self, url):
+        self.current_url = url
+        self.visited.append(url)
+
+    def find_element(self, by=None, value=None):
+        return MagicMock(name=f"element[{value}]")
+
+    def find_elements(self, by=None, value=None):
+        return []
+
+    def execute_script(self, script, *args):
+        # wait_for_page_load polls document.readyState
+        return "complete" if "readyState" in script else None
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return {}
+
+    def delete_all_cookies(self):
+        pass
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        pass
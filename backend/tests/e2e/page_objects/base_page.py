@@ -1,13 +1,49 @@
 """
 Base Page Object - All page objects inherit from this
 """
+import sys
+from functools import lru_cache
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Select-all chord; NULL releases the modifier so the text after it types normally
+SELECT_ALL = (Keys.COMMAND if sys.platform == "darwin" else Keys.CONTROL, "a", Keys.NULL)
+
+# Text of the first match whose trimmed text is non-empty, else null
+FIRST_TEXT_JS = """
+for (const e of document.querySelectorAll(arguments[0])) {
+    const text = e.textContent.trim();
+    if (text) return text;
+}
+return null;
+"""
+
+# Resolves true once location.hash is on the route, false after the timeout.
+# Vue Router's hash history navigates with pushState, which fires no
+# hashchange event, so the check runs in-page on a ~frame interval instead
+WAIT_FOR_ROUTE_JS = """
+const [route, timeoutMs, done] = arguments;
+const deadline = performance.now() + timeoutMs;
+(function check() {
+    if (location.hash.startsWith('#' + route)) return done(true);
+    if (performance.now() > deadline) return done(false);
+    setTimeout(check, 16);
+})();
+"""
+
+
+@lru_cache(maxsize=None)
+def condition(expected, locator):
+    """expected(locator), built once per process (locators are class-level tuples)"""
+    return expected(locator)
+
 
 class BasePage:
     """Base class for all page objects"""
@@ -15,18 +51,44 @@ class BasePage:
     def __init__(self, driver, config):
         self.driver = driver
         self.config = config
-        self.wait = WebDriverWait(driver, config.EXPLICIT_WAIT)
+        self.wait = WebDriverWait(driver, config.EXPLICIT_WAIT, poll_frequency=config.POLL_FREQUENCY)
+        # locator -> WebElement, valid until the next navigation
+        self._el_cache = {}
+        # timeout -> WebDriverWait, for callers that need a non-default timeout
+        self._waits = {config.EXPLICIT_WAIT: self.wait}
+
+    def wait_for(self, timeout):
+        """WebDriverWait with the given timeout, created once per page object"""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=self.config.POLL_FREQUENCY)
+            self._waits[timeout] = wait
+        return wait
 
     def open(self, url):
         """Navigate to URL"""
         logger.info(f"Navigating to: {url}")
+        self.invalidate_cache()
         self.driver.get(url)
 
+    def invalidate_cache(self):
+        """Forget located elements (call after anything that replaces the page)"""
+        self._el_cache.clear()
+
     def find_element(self, locator):
-        """Find element with explicit wait"""
+        """Find element with explicit wait, reusing it while it is still attached"""
+        element = self._el_cache.get(locator)
+        if element is not None:
+            try:
+                element.is_enabled()
+                return element
+            except StaleElementReferenceException:
+                del self._el_cache[locator]
+
         try:
-            element = self.wait.until(EC.presence_of_element_located(locator))
+            element = self.wait.until(condition(EC.presence_of_element_located, locator))
             logger.debug(f"Found element: {locator}")
+            self._el_cache[locator] = element
             return element
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
@@ -35,7 +97,7 @@ class BasePage:
     def click(self, locator, use_js_fallback=True):
         """Click element with wait and optional JavaScript fallback"""
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
+            element = self.wait.until(condition(EC.element_to_be_clickable, locator))
             logger.info(f"Clicking element: {locator}")
             element.click()
         except TimeoutException:
@@ -47,12 +109,50 @@ class BasePage:
             else:
                 raise
 
-    def type_text(self, locator, text):
-        """Type text into input field"""
-        element = self.find_element(locator)
-        element.clear()
+    def click_to_route(self, locator, route):
+        """Click a router link and wait until the hash route changes to route"""
+        self.click(locator)
+        self.wait_for_route(route)
+        # The router swapped the view, so cached elements are gone
+        self.invalidate_cache()
+
+    def wait_for_route(self, route, timeout=None):
+        """Wait in one round-trip until the hash route starts with route
+
+        Raises TimeoutException like an explicit wait would (chromedriver's own
+        script timeout, 30s by default, surfaces as TimeoutException too).
+        """
+        timeout = self.config.EXPLICIT_WAIT if timeout is None else timeout
+        reached = self.driver.execute_async_script(WAIT_FOR_ROUTE_JS, route, timeout * 1000)
+        if not reached:
+            raise TimeoutException(f"Route {route} not reached within {timeout}s")
+
+    def type_text(self, locator, text, element=None):
+        """Type text into input field and return the element typed into
+
+        Pass an already-resolved element for locator to skip the lookup.
+        """
+        if element is None:
+            element = self.find_element(locator)
         logger.info(f"Typing text into {locator}: {text}")
-        element.send_keys(text)
+        try:
+            self._replace_value(element, text)
+        except StaleElementReferenceException:
+            # Re-rendered since it was resolved: look it up once more
+            self._el_cache.pop(locator, None)
+            element = self.find_element(locator)
+            self._replace_value(element, text)
+        return element
+
+    @staticmethod
+    def _replace_value(element, text):
+        """Overwrite the field's value with real key events"""
+        if text:
+            # One round-trip: typing over a full selection replaces it, where
+            # clear() + send_keys() costs two
+            element.send_keys(*SELECT_ALL, text)
+        else:
+            element.clear()
 
     def get_text(self, locator):
         """Get element text"""
@@ -63,21 +163,36 @@ class BasePage:
 
     def is_element_visible(self, locator, timeout=None):
         """Check if element is visible"""
+        wait = self.wait if timeout is None else self.wait_for(timeout)
         try:
-            wait_time = timeout or self.config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(EC.visibility_of_element_located(locator))
+            wait.until(condition(EC.visibility_of_element_located, locator))
             return True
         except TimeoutException:
             return False
 
+    def first_text(self, locator):
+        """Non-empty text of the first CSS match, or None, in one round-trip without waiting
+
+        For absence checks: an explicit wait would poll until its timeout
+        whenever the element (the common case) never shows up.
+        """
+        by, selector = locator
+        if by != By.CSS_SELECTOR:
+            raise ValueError(f"first_text needs a CSS selector locator, got {by!r}")
+        return self.driver.execute_script(FIRST_TEXT_JS, selector)
+
     def get_current_url(self):
         """Get current page URL"""
         return self.driver.current_url
 
     def wait_for_page_load(self):
-        """Wait for page to load completely"""
+        """Wait until the DOM is parsed
+
+        Matches the 'eager' page load strategy: subresources may still be
+        loading, and the element waits in find_element/click cover the SPA
+        mounting its components.
+        """
         self.wait.until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
+            lambda driver: driver.execute_script("return document.readyState") != "loading"
         )
-        logger.info("Page loaded completely")
+        logger.info("Page DOM loaded")
@@ -2,9 +2,9 @@
 Dashboard Page Object
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 from .base_page import BasePage
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -14,24 +14,24 @@ class DashboardPage(BasePage):
 
     # Locators
     CHAT_INPUT = (By.CSS_SELECTOR, "textarea, input[placeholder*='message'], input[placeholder*='Message']")
-    SEND_BUTTON = (By.CSS_SELECTOR, "button[type='submit'], button:has(svg)")
-    FILE_UPLOAD_BUTTON = (By.CSS_SELECTOR, "input[type='file'], button:has(.upload)")
-    NEW_CHAT_BUTTON = (By.CSS_SELECTOR, "button:contains('New'), button[title*='New']")
+    # data-testid hooks in Dashboard.vue; :contains() is not CSS and :has() forces subtree scans
+    SEND_BUTTON = (By.CSS_SELECTOR, "[data-testid='send-btn']")
+    FILE_UPLOAD_BUTTON = (By.CSS_SELECTOR, "input[type='file']")
+    NEW_CHAT_BUTTON = (By.CSS_SELECTOR, "[data-testid='new-chat']")
     CONVERSATION_LIST = (By.CSS_SELECTOR, ".conversation-item, .chat-item")
     MESSAGE_CONTAINER = (By.CSS_SELECTOR, ".chat-message, .message")
     USER_MENU = (By.CSS_SELECTOR, ".user-menu, .avatar")
-    LOGOUT_BUTTON = (By.CSS_SELECTOR, "button:contains('Logout'), a[href*='logout']")
+    LOGOUT_BUTTON = (By.CSS_SELECTOR, "[data-testid='logout-btn']")
 
     def __init__(self, driver, config):
         super().__init__(driver, config)
-        self.url = f"{config.BASE_URL}/dashboard"
+        self.url = f"{config.BASE_URL}/#/dashboard"
 
     def navigate(self):
         """Navigate to dashboard page"""
         self.open(self.url)
         self.wait_for_page_load()
         logger.info("Navigated to dashboard page")
-        time.sleep(2)
 
     def is_on_dashboard(self):
         """Check if on dashboard page"""
@@ -42,8 +42,9 @@ class DashboardPage(BasePage):
         """Enter a chat message"""
         logger.info(f"Entering message: {message}")
         try:
-            self.type_text(self.CHAT_INPUT, message)
-            time.sleep(1)
+            chat_input = self.type_text(self.CHAT_INPUT, message)
+            # Wait for the bound value to settle instead of sleeping
+            self.wait.until(lambda driver: chat_input.get_attribute("value") == message)
             return True
         except Exception as e:
             logger.warning(f"Could not enter message: {e}")
@@ -54,7 +55,6 @@ class DashboardPage(BasePage):
         logger.info("Clicking send button")
         try:
             self.click(self.SEND_BUTTON)
-            time.sleep(2)
             return True
         except Exception as e:
             logger.warning(f"Could not click send button: {e}")
@@ -68,10 +68,11 @@ class DashboardPage(BasePage):
 
     def get_messages_count(self):
         """Get count of messages in chat"""
+        # find_elements returns [] on a miss, so only driver errors can land here
         try:
             messages = self.driver.find_elements(*self.MESSAGE_CONTAINER)
             return len(messages)
-        except:
+        except WebDriverException:
             return 0
 
     def click_new_chat(self):
@@ -79,7 +80,6 @@ class DashboardPage(BasePage):
         logger.info("Clicking new chat button")
         try:
             self.click(self.NEW_CHAT_BUTTON)
-            time.sleep(2)
             return True
         except Exception as e:
             logger.warning(f"Could not click new chat button: {e}")
@@ -91,7 +91,6 @@ class DashboardPage(BasePage):
         try:
             file_input = self.find_element(self.FILE_UPLOAD_BUTTON)
             file_input.send_keys(file_path)
-            time.sleep(3)
             return True
         except Exception as e:
             logger.warning(f"Could not upload file: {e}")
@@ -0,0 +1,35 @@
+"""
+Form Page Object - Shared behaviour of the login and register forms
+"""
+from selenium.webdriver.common.by import By
+from .base_page import BasePage
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class FormPage(BasePage):
+    """Base class for auth forms; subclasses set USERNAME_INPUT and PASSWORD_INPUT
+
+    The enter_* helpers return the element typed into, so callers can read
+    it back without another lookup.
+    """
+
+    USERNAME_INPUT = None
+    PASSWORD_INPUT = None
+    ERROR_MESSAGE = (By.CSS_SELECTOR, ".error-text, .global-error")
+
+    def enter_username(self, username, element=None):
+        """Enter username"""
+        logger.info(f"Entering username: {username}")
+        return self.type_text(self.USERNAME_INPUT, username, element)
+
+    def enter_password(self, password, element=None):
+        """Enter password"""
+        logger.info("Entering password")
+        return self.type_text(self.PASSWORD_INPUT, password, element)
+
+    def get_error_message(self):
+        """Get error message text (None when no error is shown)"""
+        # The .error-text slots are always rendered, just empty without an error
+        return self.first_text(self.ERROR_MESSAGE)
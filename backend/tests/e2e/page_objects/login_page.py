@@ -1,87 +1,144 @@
 """
 Login Page Object
 """
+from urllib.parse import urlparse
+
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from .base_page import condition
+from .form_page import FormPage
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
+# Bit i is set when the element matching the i-th selector argument is displayed
+FIELD_VISIBILITY_JS = """
+return Array.from(arguments).reduce((mask, selector, bit) => {
+    const e = document.querySelector(selector);
+    const visible = e && e.offsetParent !== null && getComputedStyle(e).visibility !== 'hidden';
+    return visible ? mask | (1 << bit) : mask;
+}, 0);
+"""
+
 
-class LoginPage(BasePage):
+class LoginPage(FormPage):
     """Login page object model"""
 
-    # Locators - using correct selectors based on actual HTML
-    USERNAME_INPUT = (By.CSS_SELECTOR, "input.form-input[type='text'], input[placeholder*='username'], input[placeholder*='Username']")
-    PASSWORD_INPUT = (By.CSS_SELECTOR, "input[type='password']")
-    LOGIN_BUTTON = (By.CSS_SELECTOR, "button.login-btn, button[type='submit']:not(.send-code-btn)")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, ".error-text, .global-error")
+    # Locators - ids/classes from Login.vue (cheaper than attribute-substring matches)
+    USERNAME_INPUT = (By.ID, "login-username")
+    PASSWORD_INPUT = (By.ID, "login-password")
+    LOGIN_BUTTON = (By.CSS_SELECTOR, "button.login-btn")
+    START_BUTTON = (By.CSS_SELECTOR, "button.start-btn")
+    # router-link hrefs under hash history
+    REGISTER_LINK = (By.CSS_SELECTOR, "a[href='#/register']")
+    FORGOT_PASSWORD_LINK = (By.CSS_SELECTOR, "a[href='#/reset-password']")
+
+    # field_visibility_mask() bits
+    USERNAME_VISIBLE = 1
+    PASSWORD_VISIBLE = 2
+    LOGIN_BUTTON_VISIBLE = 4
+    ALL_FIELDS_VISIBLE = USERNAME_VISIBLE | PASSWORD_VISIBLE | LOGIN_BUTTON_VISIBLE
 
     def __init__(self, driver, config):
         super().__init__(driver, config)
-        self.url = f"{config.BASE_URL}/login"
+        # Hash-history router: a bare /login path renders the welcome route
+        self.url = f"{config.BASE_URL}/#/login"
 
     def navigate(self):
         """Navigate to login page"""
         self.open(self.url)
-        self.wait_for_page_load()
 
-        # Check if we're on the welcome page and need to click Start
-        from selenium.webdriver.common.by import By
+        # Routed straight to the login form: no welcome page to detect, and
+        # the mounted form implies the DOM is parsed, so one wait covers both
+        if urlparse(self.get_current_url()).fragment.startswith("/login"):
+            try:
+                self.wait.until(condition(EC.presence_of_element_located, self.USERNAME_INPUT))
+            except TimeoutException:
+                logger.warning("Login form did not appear")
+            logger.info("Navigated to login page")
+            return
+
+        self.wait_for_page_load()
+        # Otherwise the router may show the welcome page first; wait for either it or the login form
         try:
-            start_button = self.driver.find_element(By.CSS_SELECTOR, "button.start-btn")
-            if start_button.is_displayed():
-                logger.info("On welcome page, clicking Start button")
-                start_button.click()
-                time.sleep(3)  # Wait for transition
-        except:
+            self.wait.until(EC.any_of(
+                condition(EC.visibility_of_element_located, self.START_BUTTON),
+                condition(EC.presence_of_element_located, self.USERNAME_INPUT)
+            ))
+        except TimeoutException:
+            logger.warning("Neither welcome page nor login form appeared")
+
+        start_buttons = self.driver.find_elements(*self.START_BUTTON)
+        if start_buttons and start_buttons[0].is_displayed():
+            logger.info("On welcome page, clicking Start button")
+            start_buttons[0].click()
+            self.invalidate_cache()
+            # Wait for the transition to the login form
+            self.wait.until(condition(EC.visibility_of_element_located, self.USERNAME_INPUT))
+        else:
             logger.info("Not on welcome page or Start button not found")
 
         logger.info("Navigated to login page")
-        time.sleep(2)  # Give time to see the page
-
-    def enter_username(self, username):
-        """Enter username"""
-        logger.info(f"Entering username: {username}")
-        self.type_text(self.USERNAME_INPUT, username)
-        time.sleep(1)
-
-    def enter_password(self, password):
-        """Enter password"""
-        logger.info("Entering password")
-        self.type_text(self.PASSWORD_INPUT, password)
-        time.sleep(1)
 
     def click_login(self):
         """Click login button"""
         logger.info("Clicking login button")
-        # Extra wait to ensure form validation is complete
-        time.sleep(1)
+        # click() waits for the button to become clickable
         self.click(self.LOGIN_BUTTON)
-        time.sleep(2)
+
+    def click_register_link(self):
+        """Follow the sign-up link to the register page"""
+        logger.info("Clicking register link")
+        self.click_to_route(self.REGISTER_LINK, "/register")
+
+    def click_forgot_password_link(self):
+        """Follow the forgot-password link to the reset page"""
+        logger.info("Clicking forgot password link")
+        self.click_to_route(self.FORGOT_PASSWORD_LINK, "/reset-password")
 
     def login(self, username, password):
         """Complete login flow"""
         logger.info(f"Logging in with username: {username}")
-        self.enter_username(username)
-        self.enter_password(password)
+        # Resolve both fields once for the whole flow
+        username_el = self.find_element(self.USERNAME_INPUT)
+        password_el = self.find_element(self.PASSWORD_INPUT)
+        self.enter_username(username, element=username_el)
+        self.enter_password(password, element=password_el)
         self.click_login()
 
-        # Wait for redirect to dashboard
+        # Wait for the redirect to dashboard or for the error message
         try:
-            self.wait.until(lambda driver: "/dashboard" in driver.current_url or "/login" in driver.current_url)
-            logger.info(f"Login completed. Current URL: {self.get_current_url()}")
-        except:
+            # The first .error-text slot is always rendered (empty), so check
+            # for any error text rather than the first match's visibility
+            self.wait.until(EC.any_of(
+                EC.url_contains("/dashboard"),
+                lambda driver: self.get_error_message()
+            ))
+            current_url = self.get_current_url()
+            logger.info(f"Login completed. Current URL: {current_url}")
+            if "/dashboard" in current_url:
+                # The login view is gone; an error leaves the form (and cache) in place
+                self.invalidate_cache()
+        except TimeoutException:
             logger.warning("No redirect detected")
 
+    def read_form_values(self):
+        """(username, password) field values, read in one round-trip"""
+        return tuple(self.driver.execute_script(
+            "return [document.getElementById(arguments[0]).value,"
+            " document.getElementById(arguments[1]).value];",
+            self.USERNAME_INPUT[1], self.PASSWORD_INPUT[1]
+        ))
+
+    def field_visibility_mask(self):
+        """Which core form controls are displayed, as *_VISIBLE bits, in one round-trip"""
+        return self.driver.execute_script(
+            FIELD_VISIBILITY_JS,
+            f"#{self.USERNAME_INPUT[1]}", f"#{self.PASSWORD_INPUT[1]}", self.LOGIN_BUTTON[1]
+        )
+
     def is_login_successful(self):
         """Check if login was successful"""
         current_url = self.get_current_url()
         return "/dashboard" in current_url
-
-    def get_error_message(self):
-        """Get error message text"""
-        if self.is_element_visible(self.ERROR_MESSAGE, timeout=5):
-            return self.get_text(self.ERROR_MESSAGE)
-        return None
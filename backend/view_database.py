@@ -7,17 +7,24 @@ import sys
 import io
 from datetime import datetime
 
+from scripts.db_utils import open_db
+
 # Windows 控制台 UTF-8 支持
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+def connect(db_path):
+    """打开只读连接 (整个查看过程共用一个连接)"""
+    conn = open_db(db_path, query_only=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
 def print_separator(char='=', length=80):
     print(char * length)
 
-def show_tables(db_path):
+def show_tables(conn):
     """显示所有表"""
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     print_separator()
@@ -30,12 +37,10 @@ def show_tables(db_path):
     for idx, table in enumerate(tables, 1):
         print(f"{idx}. {table[0]}")
 
-    conn.close()
     return [t[0] for t in tables]
 
-def show_table_schema(db_path, table_name):
+def show_table_schema(conn, table_name):
     """显示表结构"""
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     print_separator()
@@ -52,12 +57,16 @@ def show_table_schema(db_path, table_name):
         col_id, name, col_type, not_null, default_val, pk = col
         print(f"{col_id:<6} {name:<20} {col_type:<15} {'是' if not_null else '否':<6} {str(default_val or 'NULL'):<15} {'是' if pk else '否':<6}")
 
-    conn.close()
+def format_cell(val):
+    """单元格显示文本 (数字不截断, 其余截断到 15 个字符)"""
+    if val is None:
+        return "NULL"
+    if isinstance(val, (int, float)):
+        return str(val)
+    return str(val)[:15]
 
-def show_table_data(db_path, table_name, limit=10):
+def show_table_data(conn, table_name, limit=10):
     """显示表数据"""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
     # 获取行数
@@ -80,28 +89,16 @@ def show_table_data(db_path, table_name, limit=10):
         print(header)
         print_separator('-')
 
-        # 打印数据
-        for row in rows:
-            values = []
-            for col in columns:
-                val = row[col]
-                if val is None:
-                    val_str = "NULL"
-                elif isinstance(val, (int, float)):
-                    val_str = str(val)
-                else:
-                    val_str = str(val)[:15]
-                values.append(f"{val_str:<15}")
-            print(" | ".join(values))
+        # 打印数据 (行模板只构建一次, 所有行一次输出)
+        row_template = " | ".join(["{:<15}"] * len(columns))
+        print("\n".join(row_template.format(*map(format_cell, row)) for row in rows))
     else:
         print("(空表)")
 
-    conn.close()
     return total_rows
 
-def show_indexes(db_path):
+def show_indexes(conn):
     """显示所有索引"""
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     print_separator()
@@ -126,11 +123,8 @@ def show_indexes(db_path):
         if sql:
             print(f"  SQL: {sql}")
 
-    conn.close()
-
-def show_foreign_keys(db_path, table_name):
+def show_foreign_keys(conn, table_name):
     """显示外键关系"""
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     print_separator()
@@ -149,40 +143,36 @@ def show_foreign_keys(db_path, table_name):
     else:
         print("(无外键)")
 
-    conn.close()
+def sql_literal(val):
+    """把单个值转换为 SQL 字面量"""
+    if val is None:
+        return "NULL"
+    if isinstance(val, str):
+        return "'" + val.replace("'", "''") + "'"
+    return str(val)
 
-def export_table_to_sql(db_path, table_name, output_file):
-    """导出表的 INSERT 语句"""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+# 导出时每批从游标读取的行数
+EXPORT_BATCH_SIZE = 1000
 
+def export_table_to_sql(conn, table_name, output_file):
+    """导出表的 INSERT 语句 (按批写入, 内存占用与表大小无关)"""
+    cursor = conn.cursor()
+    # 文件头需要总行数, 先单独计数
+    total_rows = cursor.execute(f"SELECT COUNT(*) FROM {table_name};").fetchone()[0]
     cursor.execute(f"SELECT * FROM {table_name};")
-    rows = cursor.fetchall()
 
-    with open(output_file, 'w', encoding='utf-8') as f:
+    # 列名与语句前缀只计算一次
+    columns = [desc[0] for desc in cursor.description]
+    prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ("
+
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
         f.write(f"-- 表: {table_name}\n")
         f.write(f"-- 导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"-- 总行数: {len(rows)}\n\n")
-
-        for row in rows:
-            columns = list(row.keys())
-            values = []
-            for col in columns:
-                val = row[col]
-                if val is None:
-                    values.append("NULL")
-                elif isinstance(val, str):
-                    escaped_val = val.replace("'", "''")
-                    values.append(f"'{escaped_val}'")
-                else:
-                    values.append(str(val))
-
-            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(values)});\n"
-            f.write(sql)
-
-    conn.close()
-    print(f"\n✅ 已导出 {len(rows)} 行数据到: {output_file}")
+        f.write(f"-- 总行数: {total_rows}\n\n")
+        while rows := cursor.fetchmany(EXPORT_BATCH_SIZE):
+            f.writelines(prefix + ", ".join(map(sql_literal, row)) + ");\n" for row in rows)
+
+    print(f"\n✅ 已导出 {total_rows} 行数据到: {output_file}")
 
 def main():
     db_path = r"C:\Users\tomyb\Desktop\vue3-rag-frontend2\backend\app\core\users.db"
@@ -192,36 +182,38 @@ def main():
     print("="*80)
     print(f"数据库文件: {db_path}\n")
 
+    conn = connect(db_path)
+    try:
+        run_viewer(conn)
+    finally:
+        conn.close()
+
+def run_viewer(conn):
+    """显示全部信息并按需导出 (共用同一个连接)"""
     # 显示所有表
-    tables = show_tables(db_path)
+    tables = show_tables(conn)
 
     print("\n")
 
-    # 显示每个表的详细信息
+    # 显示每个表的详细信息 (行数顺便留给统计部分使用)
+    row_counts = {}
     for table in tables:
-        show_table_schema(db_path, table)
+        show_table_schema(conn, table)
         print()
-        total_rows = show_table_data(db_path, table, limit=5)
+        row_counts[table] = show_table_data(conn, table, limit=5)
         print()
-        show_foreign_keys(db_path, table)
+        show_foreign_keys(conn, table)
         print("\n")
 
     # 显示索引
-    show_indexes(db_path)
+    show_indexes(conn)
 
     print("\n" + "="*80)
     print("📊 数据库统计")
     print("="*80)
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
     for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table};")
-        count = cursor.fetchone()[0]
-        print(f"表 {table:<20}: {count:>6} 行")
-
-    conn.close()
+        print(f"表 {table:<20}: {row_counts[table]:>6} 行")
 
     print("\n" + "="*80)
     print("✨ 查看完成！")
@@ -240,14 +232,14 @@ def main():
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             for table in tables:
                 output_file = f"{table}_{timestamp}.sql"
-                export_table_to_sql(db_path, table, output_file)
+                export_table_to_sql(conn, table, output_file)
         elif choice == '2':
             print(f"\n可用的表: {', '.join(tables)}")
             table_name = input("请输入表名: ").strip()
             if table_name in tables:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 output_file = f"{table_name}_{timestamp}.sql"
-                export_table_to_sql(db_path, table_name, output_file)
+                export_table_to_sql(conn, table_name, output_file)
             else:
                 print("❌ 表不存在")
     except KeyboardInterrupt: